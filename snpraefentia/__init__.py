@@ -1,7 +1,11 @@
 """SNPraefentia: SNP Prioritization Tool"""
 
+import functools
+
 __version__ = "2.0.0"
 
+__all__ = ["SNPAnalyst", "check_dependencies"]
+
 # Strict dependency list: all are required for full functionality
 REQUIRED_LIBRARIES = [
     "pandas",
@@ -24,14 +28,28 @@ def check_dependencies(raise_on_missing: bool = False):
     Returns:
         dict: {'missing': [...]} list of missing packages.
     """
-    missing = [lib for lib in REQUIRED_LIBRARIES if not _is_importable(lib)]
+    missing = list(_missing_dependencies())
     if raise_on_missing and missing:
         raise ImportError(f"Required packages missing: {', '.join(missing)}")
     return {"missing": missing}
 
+@functools.lru_cache(maxsize=1)
+def _missing_dependencies():
+    # Installed packages don't change during a run, so look them up once
+    return tuple(lib for lib in REQUIRED_LIBRARIES if not _is_importable(lib))
+
 def _is_importable(lib: str) -> bool:
+    # find_spec locates the package without executing it, so checking
+    # doesn't import pandas, matplotlib and the rest up front
+    import importlib.util
     try:
-        __import__(lib)
-        return True
-    except ImportError:
-        return False
\ No newline at end of file
+        return importlib.util.find_spec(lib) is not None
+    except (ImportError, ValueError):
+        return False
+
+def __getattr__(name):
+    # Load the analysis pipeline (and pandas with it) on first access only
+    if name == "SNPAnalyst":
+        from .core import SNPAnalyst
+        return SNPAnalyst
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
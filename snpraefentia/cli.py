@@ -21,22 +21,44 @@ allowing users to interact with the SNP analysis functionality through
 command-line arguments and options.
 """
 
-import argparse
 import logging
+import logging.handlers
 import sys
 import os
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
 from . import __version__, check_dependencies
-from .core import SNPAnalyst
+from .console import get_console
+
+# Extension appended to the output path for each --format choice
+_FORMAT_EXT = {"excel": ".xlsx", "csv": ".csv", "tsv": ".tsv", "parquet": ".parquet", "feather": ".feather"}
+_OUTPUT_EXTENSIONS = frozenset({".xlsx", ".xls", ".csv", ".tsv", ".txt", ".parquet", ".feather"})
+
+def _fast_path_help_or_version(argv):
+    """Detect help/version requests without building the argument parser.
+    
+    Only a bare help or version flag is answered here; any other argument
+    list goes through argparse, so invalid combinations still get its
+    usage error.
+    
+    Args:
+        argv: Command-line arguments, excluding the program name
+        
+    Returns:
+        "help", "version", or None when the full parser is needed
+    """
+    if argv in ([], ["-h"], ["--help"]):
+        return "help"
+    if argv == ["--version"]:
+        return "version"
+    return None
 
 class SNPraefentiaCLI:
     def __init__(self):
         self.logger = None
-        self.console = Console()
+
+    @property
+    def console(self):
+        """Rich console shared with the analysis pipeline."""
+        return get_console()
 
     def setup_logging(self, log_file=None, verbose=False, quiet=False):
         """Configure logging based on command line arguments."""
@@ -45,21 +67,44 @@ class SNPraefentiaCLI:
             log_level = logging.DEBUG
         elif quiet:
             log_level = logging.ERROR
-        logging.basicConfig(
-            level=log_level,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S"
-        )
-        if log_file:
-            file_handler = logging.FileHandler(log_file)
+        root = logging.getLogger()
+        if root.handlers:
+            # Already configured (e.g. a second run in the same process)
+            root.setLevel(log_level)
+        else:
+            logging.basicConfig(
+                level=log_level,
+                format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S"
+            )
+        if log_file and not self._has_file_handler(root, log_file):
+            # delay=True: the file is only created once something is logged
+            file_handler = logging.FileHandler(log_file, delay=True)
             file_handler.setFormatter(logging.Formatter(
                 "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
             ))
-            logging.getLogger().addHandler(file_handler)
+            # Write records in batches rather than one write per record; errors
+            # are flushed straight away and logging.shutdown flushes the rest
+            root.addHandler(logging.handlers.MemoryHandler(
+                capacity=8192, flushLevel=logging.ERROR, target=file_handler
+            ))
         self.logger = logging.getLogger("snprior")
 
+    @staticmethod
+    def _has_file_handler(logger, log_file):
+        """Check whether a logger already writes to the given file."""
+        path = os.path.abspath(log_file)
+        for handler in logger.handlers:
+            if isinstance(handler, logging.handlers.MemoryHandler):
+                handler = handler.target
+            if isinstance(handler, logging.FileHandler) and handler.baseFilename == path:
+                return True
+        return False
+
     def print_banner(self):
         """Print the SNPraefentia banner with Rich formatting."""
+        from rich.panel import Panel
+        from rich.text import Text
         banner = r"""
  ____  _   _ ____                  __            _   _       
 / ___|| \ | |  _ \ _ __ __ _  ___ / _| ___ _ __ | |_(_) __ _ 
@@ -77,16 +122,19 @@ class SNPraefentiaCLI:
 
     def print_help_table(self):
         """Print help information in a tabular format using Rich."""
+        from rich import box
+        from rich.table import Table
         table = Table(show_header=True, header_style="bold blue", box=box.ROUNDED, highlight=True)
         table.add_column("Options", style="bold cyan", width=30, min_width=25)
         table.add_column("Description", style="white", min_width=40)
         
         table.add_row("-h, --help", "Show this help message and exit")
-        table.add_row("-i, --input", "Path to input file ('supports .xlsx, .xls, .csv, .tsv')")
+        table.add_row("-i, --input", "Path to input file ('supports .xlsx, .xls, .csv, .tsv, .parquet, .feather')")
         table.add_row("-s, --specie", "Bacterial specie name (e.g., 'Bacteroides uniformis')")
-        table.add_row("-o, --output", "Path to save output file ('supports .xlsx, .xls, .csv, .tsv')")
-        table.add_row("-f, --format", "Output format override ('excel/csv/tsv')")
+        table.add_row("-o, --output", "Path to save output file ('supports .xlsx, .xls, .csv, .tsv, .parquet, .feather')")
+        table.add_row("-f, --format", "Output format override ('excel/csv/tsv/parquet/feather')")
         table.add_row("-ut, --uniprot-tolerance", "Length tolerance for UniProt entries (default: 50)")
+        table.add_row("-j, --jobs", "Worker processes for parsing large inputs (default: 1)")
         table.add_row("-v, --verbose", "Increase output verbosity")
         table.add_row("-q, --quiet", "Suppress all non-error output")
         table.add_row("-l, --log-file", "Path to save log file")
@@ -94,7 +142,20 @@ class SNPraefentiaCLI:
         
         self.console.print(table)
 
+    def print_help(self):
+        """Print the help table followed by the project link."""
+        from rich.panel import Panel
+        from rich.text import Text
+        self.print_help_table()
+        self.console.print(Panel(Text("For more information, visit: https://github.com/muneebdev7/SNPraefentia", justify="center"), style="bold green", expand=False))
+
+    def print_version(self):
+        """Print the package version."""
+        self.console.print(f"SNPraefentia version {__version__}", style="bold green")
+
     def parse_args(self):
+        # Only needed once the help/version fast path has been ruled out
+        import argparse
         parser = argparse.ArgumentParser(
             description="SNPraefentia: SNP Prioritization Tool",
             epilog="For more information, visit: https://github.com/muneebdev7/SNPraefentia",
@@ -102,15 +163,17 @@ class SNPraefentiaCLI:
         )
         parser.add_argument("-h", "--help", action="store_true", help="Show this help message and exit")
         parser.add_argument("--input", "-i", required=False, 
-                            help="Path to input file (supports .xlsx, .xls, .csv, .tsv, .txt)")
+                            help="Path to input file (supports .xlsx, .xls, .csv, .tsv, .txt, .parquet, .feather)")
         parser.add_argument("--specie", "-s", required=False,
                             help="Bacterial specie name (e.g., 'Bacteroides uniformis')")
         parser.add_argument("--output", "-o", required=False,
-                            help="Path to save output file (supports .xlsx, .xls, .csv, .tsv, .txt)")
-        parser.add_argument("--format", "-f", choices=["excel", "csv", "tsv"], default=None,
+                            help="Path to save output file (supports .xlsx, .xls, .csv, .tsv, .txt, .parquet, .feather)")
+        parser.add_argument("--format", "-f", choices=list(_FORMAT_EXT), default=None,
                             help="Output format override (default: determined from output file extension)")
         parser.add_argument("--uniprot-tolerance", "-ut", type=int, default=50,
                             help="Length tolerance when matching UniProt entries (default: 50)")
+        parser.add_argument("--jobs", "-j", type=int, default=1,
+                            help="Number of worker processes used to parse large inputs (default: 1)")
         parser.add_argument("--verbose", "-v", action="store_true",
                             help="Increase output verbosity")
         parser.add_argument("--quiet", "-q", action="store_true",
@@ -126,32 +189,33 @@ class SNPraefentiaCLI:
 
     def ensure_output_extension(self, args):
         output_ext = os.path.splitext(args.output)[1].lower()
-        if output_ext not in ['.xlsx', '.xls', '.csv', '.tsv', '.txt']:
-            if args.format == "excel":
-                args.output = f"{args.output}.xlsx"
-            elif args.format == "csv":
-                args.output = f"{args.output}.csv"
-            elif args.format == "tsv":
-                args.output = f"{args.output}.tsv"
-            else:
-                args.output = f"{args.output}.csv"
+        if output_ext not in _OUTPUT_EXTENSIONS:
+            args.output = f"{args.output}{_FORMAT_EXT.get(args.format, '.csv')}"
         return args
 
     def run(self):
         # Always show banner
         self.print_banner()
         
+        # Answer plain help/version requests before building the full parser
+        fast_path = _fast_path_help_or_version(sys.argv[1:])
+        if fast_path == "help":
+            self.print_help()
+            return 0
+        if fast_path == "version":
+            self.print_version()
+            return 0
+        
         args = self.parse_args()
         
-        # Handle help or no arguments
-        if args.help or len(sys.argv) == 1:
-            self.print_help_table()
-            self.console.print(Panel(Text("For more information, visit: https://github.com/muneebdev7/SNPraefentia", justify="center"), style="bold green", expand=False))
+        # Handle help mixed with other arguments
+        if args.help:
+            self.print_help()
             return 0
         
         # Handle version
         if args.version:
-            self.console.print(f"SNPraefentia version {__version__}", style="bold green")
+            self.print_version()
             return 0
         
         # Validate required arguments
@@ -178,7 +242,9 @@ class SNPraefentiaCLI:
             self.print_status(f"Target specie: {args.specie}", "cyan")
             self.print_status(f"Output will be saved to: {args.output}", "cyan")
             
-            analyst = SNPAnalyst(uniprot_tolerance=args.uniprot_tolerance)
+            # Imported here so --help/--version don't pay for pandas and friends
+            from .core import SNPAnalyst
+            analyst = SNPAnalyst(uniprot_tolerance=args.uniprot_tolerance, n_jobs=args.jobs)
             
             try:
                 analyst.run(
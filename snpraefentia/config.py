@@ -2,3 +2,18 @@
 
 # UniProt search parameters
 DEFAULT_UNIPROT_TOLERANCE = 50
+
+# Maximum number of concurrent UniProt requests
+UNIPROT_MAX_WORKERS = 16
+
+# Worker processes used to parse SNP fields, and the smallest table that
+# is worth splitting across them
+DEFAULT_N_JOBS = 1
+PARALLEL_MIN_ROWS = 50_000
+
+# Number of rows read per chunk when streaming large input files
+CHUNK_SIZE = 200_000
+
+# String columns with fewer unique values than this fraction of rows are
+# loaded as categoricals
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
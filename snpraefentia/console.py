@@ -0,0 +1,32 @@
+# Copyright 2025 SNPraefentia Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Shared Rich console.
+
+Creating a Console probes the terminal, so the CLI and every SNPAnalyst
+share a single instance that is only created when something is printed.
+"""
+
+_console = None
+
+def get_console():
+    """Return the shared Rich console, creating it on first use.
+
+    Returns:
+        rich.console.Console instance
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
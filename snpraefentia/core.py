@@ -23,33 +23,119 @@ calculating impacts score, and managing the overall analysis workflow.
 """
 
 import logging
+import itertools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
 import pandas as pd
-from rich.console import Console
-from .processors.depth import extract_depth, normalize_depth
-from .processors.amino_acid import extract_aa_change, compute_aa_impact
+from pandas.api.types import union_categoricals
+from rich.text import Text
+from .console import get_console
+from .processors.depth import extract_depth_series, normalize_depth
+from .processors.amino_acid import extract_aa_change_series, compute_aa_impact_series
 from .processors.taxonomy import validate_specie_name, get_taxid
-from .processors.uniprot import search_uniprot, check_domain_position
-from .io.loader import load_data
+from .processors.uniprot import search_uniprot, fetch_domain_ranges, positions_in_domains
+from .io.cache import cached_lookup
+from .io.loader import load_data_chunks
 from .io.writer import save_data
-from .scoring import calculate_priority_score
+from .scoring import _score_from_arrays
+from .config import UNIPROT_MAX_WORKERS, DEFAULT_N_JOBS, PARALLEL_MIN_ROWS
+
+# Network lookups repeat heavily across rows and runs
+get_taxid = cached_lookup(get_taxid)
+search_uniprot = cached_lookup(search_uniprot)
+fetch_domain_ranges = cached_lookup(fetch_domain_ranges)
 
 logger = logging.getLogger(__name__)
 
+def extract_row_features(evidence, effects, positions):
+    """Parse the columns that depend only on each SNP's own fields.
+    
+    Kept at module level so it can be sent to worker processes.
+    
+    Args:
+        evidence: Series of evidence strings
+        effects: Series of SnpEff effect strings
+        positions: Series of "position/length" strings
+        
+    Returns:
+        DataFrame with Depth, AA_Change, Amino_Acid_Impact_Score,
+        Total_Protein_Length and Mutated_AA columns
+    """
+    aa_change = extract_aa_change_series(effects).astype('category')
+    # Score each distinct change once; rows without one (code -1) score 0
+    impact = np.append(compute_aa_impact_series(aa_change.cat.categories), 0.0)
+    
+    # "position/length" split in a single pass; partition drops the separator
+    # and suffix columns when no value has a "/", e.g. an all-missing chunk
+    parts = positions.astype('string').str.partition('/').reindex(columns=[0, 1, 2])
+    has_length = parts[1] == '/'
+    
+    return pd.DataFrame({
+        'Depth': extract_depth_series(evidence),
+        'AA_Change': aa_change,
+        'Amino_Acid_Impact_Score': impact[aa_change.cat.codes.to_numpy()],
+        'Total_Protein_Length': pd.to_numeric(parts[2].where(has_length), errors='coerce').astype('Int32'),
+        'Mutated_AA': pd.to_numeric(parts[0].where(has_length), errors='coerce').astype('Int32'),
+    }, index=evidence.index)
+
+def concat_frames(frames, ignore_index=True):
+    """Concatenate chunks of a table, keeping categorical columns categorical.
+    
+    pandas falls back to object dtype when categoricals with different
+    categories are concatenated, so the categories are unified first.
+    Columns whose categories differ in dtype (e.g. an all-missing chunk)
+    are converted to nullable string categories before the union.
+    
+    Args:
+        frames: List of DataFrames with the same columns
+        ignore_index: Whether to give the result a fresh RangeIndex
+        
+    Returns:
+        Concatenated DataFrame
+    """
+    if len(frames) > 1:
+        for col in frames[0].columns:
+            if all(isinstance(frame[col].dtype, pd.CategoricalDtype) for frame in frames):
+                if len({frame[col].cat.categories.dtype for frame in frames}) > 1:
+                    for frame in frames:
+                        frame[col] = frame[col].astype('string').astype('category')
+                categories = union_categoricals([frame[col] for frame in frames], sort_categories=True).categories
+                for frame in frames:
+                    frame[col] = frame[col].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=ignore_index)
+
 class SNPAnalyst:
     """Main class for SNP prioritization pipeline."""
     
-    def __init__(self, uniprot_tolerance=50):
+    def __init__(self, uniprot_tolerance=50, n_jobs=DEFAULT_N_JOBS):
         """Initialize the SNP prioritizer with parameters.
         
         Args:
             uniprot_tolerance: Length tolerance when matching UniProt entries
+            n_jobs: Number of worker processes for per-row parsing
         """
         self.uniprot_tolerance = uniprot_tolerance
-        self.console = Console()
+        self.n_jobs = max(1, n_jobs)
+        self._status_lines = []
+    
+    @property
+    def console(self):
+        """Rich console used for status messages."""
+        return get_console()
     
     def print_status(self, message, style="green"):
-        """Print status messages with Rich formatting."""
-        self.console.print(f"[+] {message}", style=f"bold {style}")
+        """Queue a status message; it is printed on the next flush_status."""
+        self._status_lines.append((message, style))
+    
+    def flush_status(self):
+        """Print queued status messages in a single console write."""
+        if not self._status_lines:
+            return
+        text = Text()
+        for message, style in self._status_lines:
+            text.append(f"[+] {message}\n", style=f"bold {style}")
+        self._status_lines.clear()
+        self.console.print(text, end="")
         
     def run(self, input_file, specie, output_file=None):
         """Run the SNP prioritization pipeline on an input file.
@@ -65,25 +151,42 @@ class SNPAnalyst:
         Raises:
             ValueError: If the specie name is invalid
         """
-        self.print_status("Loading input data...")
         try:
-            df = load_data(input_file)
-            self.print_status(f"Loaded {len(df)} SNPs from input file", "cyan")
-        except ValueError:
-            # Just re-raise the error without additional logging
-            raise
+            return self._run(input_file, specie, output_file)
+        finally:
+            self.flush_status()
+    
+    def _run(self, input_file, specie, output_file):
+        """Pipeline body for run, flushing status messages after each phase."""
+        self.print_status("Loading input data...")
+        self.flush_status()
+        chunks = load_data_chunks(input_file)
+        # Pull the first chunk now so format and column errors surface early
+        first_chunk = next(chunks)
             
         # Validate specie name before processing
         self.print_status("Validating species name...")
+        self.flush_status()
         if not validate_specie_name(specie):
             raise ValueError(
                 f"Invalid specie name: '{specie}'. Please verify the specie name and try again."
             )
         self.print_status(f"Species validated: {specie}", "cyan")
         
-        # Process the dataframe
+        # Annotate the input chunk by chunk; depth normalization and scoring
+        # need the whole table, so they run once on the concatenated result
         self.print_status("Processing SNP data...")
-        result_df = self.process_dataframe(df, specie)
+        annotated = []
+        loaded = 0
+        for number, chunk in enumerate(itertools.chain([first_chunk], chunks), start=1):
+            # Report each chunk as it arrives, since this is the longest phase
+            loaded += len(chunk)
+            self.print_status(f"Loaded chunk {number} ({loaded} SNPs so far)", "cyan")
+            self.flush_status()
+            annotated.append(self.annotate_dataframe(chunk, specie))
+        df = concat_frames(annotated)
+        self.print_status(f"Loaded {len(df)} SNPs from input file", "cyan")
+        result_df = self.score_dataframe(df)
         
         # Save results if output file specified
         if output_file:
@@ -97,6 +200,7 @@ class SNPAnalyst:
             # Save output file inside this directory
             output_path = os.path.join(output_dir, os.path.basename(output_file))
             self.print_status(f"Saving results to {output_path}", "cyan")
+            self.flush_status()
             save_data(result_df, output_path)
 
             # Generate Plots for output data using plotting module
@@ -125,66 +229,167 @@ class SNPAnalyst:
         Returns:
             Processed DataFrame with additional columns and scores
         """
+        df = self.annotate_dataframe(df, specie, tax_id)
+        return self.score_dataframe(df)
+    
+    def annotate_dataframe(self, df, specie, tax_id=None):
+        """Add the per-SNP annotations that don't depend on other rows.
+        
+        This covers every step except depth normalization and scoring, so
+        it can be applied to an input file one chunk at a time.
+        
+        Args:
+            df: DataFrame with SNP data
+            specie: Bacterial specie name
+            tax_id: Optional pre-validated taxonomy ID
+            
+        Returns:
+            New DataFrame with annotation columns added
+        """
+        # New columns are collected here and joined onto df in one step
+        annotations = {}
+        
         # Add bacterial specie if not present
         if 'Bacterial_Specie' not in df.columns:
-            df['Bacterial_Specie'] = specie
+            species = pd.Series(specie, index=df.index)
         else:
-            df['Bacterial_Specie'] = df['Bacterial_Specie'].fillna(specie)
+            species = df['Bacterial_Specie']
+            if isinstance(species.dtype, pd.CategoricalDtype) and specie not in species.cat.categories:
+                species = species.cat.add_categories([specie])
+            species = species.fillna(specie)
             
-        # Clean up specie formatting
-        df['Bacterial_Specie'] = df['Bacterial_Specie'].str.replace('_', ' ')
+        # Clean up specie formatting; the column usually holds a single value,
+        # so checking the categories is enough to skip the common no-op case.
+        # Categories are always the nullable string dtype so that chunks can
+        # be concatenated
+        species = species.astype('string').astype('category')
+        if species.cat.categories.str.contains('_', regex=False).any():
+            species = species.str.replace('_', ' ', regex=False).astype('category')
+        annotations['Bacterial_Specie'] = species
         
         # Step 2: Fetching taxonomy ID (using pre-validated ID if available)
+        # NCBI taxonomy IDs and protein positions all fit in 32 bits
         self.print_status("Fetching taxonomy ID...", "cyan")
-        df['Taxonomic_ID'] = tax_id if tax_id else df['Bacterial_Specie'].apply(get_taxid)
+        if tax_id:
+            taxids = pd.array(np.full(len(df), tax_id), dtype='Int32')
+        else:
+            self.flush_status()
+            # One lookup per distinct specie rather than per row
+            lookup = pd.array([get_taxid(name) for name in species.cat.categories], dtype='Int32')
+            taxids = lookup.take(species.cat.codes.to_numpy(), allow_fill=True)
+        annotations['Taxonomic_ID'] = taxids
         
-        # Step 3-4: Extract and normalize depth
+        # Steps 3 and 5-9 only parse the row itself, so they can be split
+        # across worker processes
         self.print_status("Processing read depth information...", "cyan")
-        df['Depth'] = df['Evidence'].apply(extract_depth)
-        #df['Depth'] = df['Max_Depth']
-        df['Normalized_Depth'] = normalize_depth(df['Depth'])
-        
-        # Step 5-7: Process amino acid changes
         self.print_status("Analyzing amino acid changes...", "cyan")
-        df['AA_Change'] = df['Effect'].apply(extract_aa_change)
-        df['Amino_Acid_Impact_Score'] = df.apply(compute_aa_impact, axis=1)
-        
-        # Step 8-9: Extract AA positions
         self.print_status("Processing protein positions...", "cyan")
-        df['Total_Protein_Length'] = df['Amino_Acid_Position'].apply(
-            lambda x: int(str(x).split('/')[-1]) if '/' in str(x) else None
-        )
-        df['Mutated_AA'] = df['Amino_Acid_Position'].apply(
-            lambda x: int(str(x).split('/')[0]) if '/' in str(x) else None
-        )
+        features = self._extract_row_features(df)
+        annotations.update(features.items())
         
         # Step 10-11: UniProt and domain analysis
         self.print_status("Searching UniProt database...", "cyan")
-        uniprot_ids = []
-        for index, row in df.iterrows():
-            gene = str(row['Gene']).split('_')[0]
-            taxid = row['Taxonomic_ID']
-            length = row['Total_Protein_Length']
-            if pd.notna(gene) and pd.notna(taxid) and pd.notna(length):
-                uid = search_uniprot(gene, taxid, length, self.uniprot_tolerance)
-            else:
-                uid = None
-            uniprot_ids.append(uid)
-        df['UniProt_ID'] = uniprot_ids
+        self.flush_status()
+        # Gene prefixes are split once per distinct gene name
+        gene_names = df['Gene'].astype('category')
+        # split rather than partition, which has no columns when there are no categories
+        prefixes = pd.Series(gene_names.cat.categories).astype('string').str.split('_', n=1).str[0]
+        genes = pd.array(prefixes, dtype='string').take(gene_names.cat.codes.to_numpy(), allow_fill=True)
+        lengths = features['Total_Protein_Length']
+        searchable = pd.notna(genes) & pd.notna(taxids) & lengths.notna().to_numpy()
+        queries = [
+            (gene, taxid, length) if ok else None
+            for gene, taxid, length, ok in zip(genes, taxids, lengths, searchable)
+        ]
+        uniprot_ids = self._lookup_concurrently(
+            lambda query: search_uniprot(*query, self.uniprot_tolerance), queries
+        )
+        # An explicit dtype keeps the categories strings when nothing matched
+        uniprot_ids = pd.Series(
+            [uniprot_ids.get(query) for query in queries], index=df.index, dtype='string'
+        ).astype('category')
+        annotations['UniProt_ID'] = uniprot_ids
         
         self.print_status("Checking domain positions...", "cyan")
-        df['Domain_Position_Match'] = df.apply(
-            lambda row: check_domain_position(row['UniProt_ID'], row['Mutated_AA']),
-            axis=1
+        self.flush_status()
+        domain_ranges = self._lookup_concurrently(
+            fetch_domain_ranges, [uid if pd.notna(uid) else None for uid in uniprot_ids]
+        )
+        # Stored as float32 once here, the dtype the scoring step works in
+        annotations['Domain_Position_Match'] = positions_in_domains(
+            uniprot_ids, features['Mutated_AA'], domain_ranges
         )
         
+        self.flush_status()
+        # Replace any existing columns of the same name (e.g. Bacterial_Specie)
+        df = df.drop(columns=[col for col in annotations if col in df.columns])
+        return pd.concat([df, pd.DataFrame(annotations, index=df.index)], axis=1)
+    
+    def _extract_row_features(self, df):
+        """Run extract_row_features, splitting large tables across processes.
+        
+        Args:
+            df: DataFrame with SNP data
+            
+        Returns:
+            DataFrame of parsed columns aligned with df
+        """
+        columns = (df['Evidence'], df['Effect'], df['Amino_Acid_Position'])
+        if self.n_jobs == 1 or len(df) < PARALLEL_MIN_ROWS:
+            return extract_row_features(*columns)
+        
+        bounds = np.linspace(0, len(df), self.n_jobs + 1, dtype=int)
+        parts = [[col.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])] for col in columns]
+        with ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
+            return concat_frames(list(executor.map(extract_row_features, *parts)), ignore_index=False)
+    
+    @staticmethod
+    def _lookup_concurrently(func, keys):
+        """Call a network lookup once per distinct key using a thread pool.
+        
+        Args:
+            func: Function taking a single key
+            keys: Iterable of hashable keys; None entries are skipped
+            
+        Returns:
+            Dictionary mapping each distinct key to its result
+        """
+        unique_keys = [key for key in dict.fromkeys(keys) if key is not None]
+        if not unique_keys:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(UNIPROT_MAX_WORKERS, len(unique_keys))) as executor:
+            return dict(zip(unique_keys, executor.map(func, unique_keys)))
+    
+    def score_dataframe(self, df):
+        """Normalize depth and compute priority scores over annotated SNPs.
+        
+        Args:
+            df: DataFrame returned by annotate_dataframe
+            
+        Returns:
+            New DataFrame with normalized depth and priority score columns
+        """
+        # Step 4: Normalize depth across all SNPs
+        normalized_depth = normalize_depth(df['Depth'])
+        
         # Step 12: Calculate final priority score
         self.print_status("Calculating final priority scores...", "cyan")
-        df['Final_Priority_Score'] = calculate_priority_score(df)
+        # Missing AA impact and domain values count as 0, as in
+        # calculate_priority_score
+        scores = _score_from_arrays(
+            normalized_depth.to_numpy(),
+            df['Amino_Acid_Impact_Score'].to_numpy(dtype=np.float32, na_value=0),
+            df['Domain_Position_Match'].to_numpy(dtype=np.float32, na_value=0)
+        )
         
-        # Add percentage score
-        df['Final_Priority_Score (%)'] = df['Final_Priority_Score'] * 100
+        # All new columns, including the percentage score, are added in one step
+        scored = df.assign(**{
+            'Normalized_Depth': normalized_depth,
+            'Final_Priority_Score': scores,
+            'Final_Priority_Score (%)': scores * 100
+        })
         
         self.print_status("SNP analysis completed successfully!", "green")
+        self.flush_status()
         
-        return df
\ No newline at end of file
+        return scored
\ No newline at end of file
@@ -17,26 +17,48 @@ This module contains reference data for amino acid properties used in
 the SNPraefentia analysis pipeline.
 """
 
-# Amino acid properties
+import numpy as np
+
+# Amino acid properties: code, weight, polarity, charge, hydrophobicity
+_AA_TABLE = (
+    ('Ala', 89.1, 'nonpolar', 'neutral', 1.8),
+    ('Arg', 174.2, 'polar', 'positive', -4.5),
+    ('Asn', 132.1, 'polar', 'neutral', -3.5),
+    ('Asp', 133.1, 'polar', 'negative', -3.5),
+    ('Cys', 121.2, 'nonpolar', 'neutral', 2.5),
+    ('Glu', 147.1, 'polar', 'negative', -3.5),
+    ('Gln', 146.2, 'polar', 'neutral', -3.5),
+    ('Gly', 75.1, 'nonpolar', 'neutral', -0.4),
+    ('His', 155.2, 'polar', 'positive', -3.2),
+    ('Ile', 131.2, 'nonpolar', 'neutral', 4.5),
+    ('Leu', 131.2, 'nonpolar', 'neutral', 3.8),
+    ('Lys', 146.2, 'polar', 'positive', -3.9),
+    ('Met', 149.2, 'nonpolar', 'neutral', 1.9),
+    ('Phe', 165.2, 'nonpolar', 'neutral', 2.8),
+    ('Pro', 115.1, 'nonpolar', 'neutral', -1.6),
+    ('Ser', 105.1, 'polar', 'neutral', -0.8),
+    ('Thr', 119.1, 'polar', 'neutral', -0.7),
+    ('Trp', 204.2, 'nonpolar', 'neutral', -0.9),
+    ('Tyr', 181.2, 'polar', 'neutral', -1.3),
+    ('Val', 117.1, 'nonpolar', 'neutral', 4.2),
+)
+
+# Three-letter codes and their row in the per-property arrays below
+AA_CODES = tuple(row[0] for row in _AA_TABLE)
+AA_INDEX = {aa: i for i, aa in enumerate(AA_CODES)}
+
+# One array per property, indexed through AA_INDEX
+AA_WEIGHT = np.array([row[1] for row in _AA_TABLE], dtype=np.float64)
+AA_HYDROPHOBICITY = np.array([row[4] for row in _AA_TABLE], dtype=np.float64)
+# 0 = nonpolar, 1 = polar
+AA_POLARITY = np.array([row[2] == 'polar' for row in _AA_TABLE], dtype=np.int8)
+# -1 = negative, 0 = neutral, 1 = positive
+AA_CHARGE = np.array(
+    [{'negative': -1, 'neutral': 0, 'positive': 1}[row[3]] for row in _AA_TABLE], dtype=np.int8
+)
+
+# Per-residue dictionaries, kept for existing importers
 AA_PROPERTIES = {
-    'Ala': {'weight': 89.1, 'polarity': 'nonpolar', 'charge': 'neutral', 'hydrophobicity': 1.8},
-    'Arg': {'weight': 174.2, 'polarity': 'polar', 'charge': 'positive', 'hydrophobicity': -4.5},
-    'Asn': {'weight': 132.1, 'polarity': 'polar', 'charge': 'neutral', 'hydrophobicity': -3.5},
-    'Asp': {'weight': 133.1, 'polarity': 'polar', 'charge': 'negative', 'hydrophobicity': -3.5},
-    'Cys': {'weight': 121.2, 'polarity': 'nonpolar', 'charge': 'neutral', 'hydrophobicity': 2.5},
-    'Glu': {'weight': 147.1, 'polarity': 'polar', 'charge': 'negative', 'hydrophobicity': -3.5},
-    'Gln': {'weight': 146.2, 'polarity': 'polar', 'charge': 'neutral', 'hydrophobicity': -3.5},
-    'Gly': {'weight': 75.1, 'polarity': 'nonpolar', 'charge': 'neutral', 'hydrophobicity': -0.4},
-    'His': {'weight': 155.2, 'polarity': 'polar', 'charge': 'positive', 'hydrophobicity': -3.2},
-    'Ile': {'weight': 131.2, 'polarity': 'nonpolar', 'charge': 'neutral', 'hydrophobicity': 4.5},
-    'Leu': {'weight': 131.2, 'polarity': 'nonpolar', 'charge': 'neutral', 'hydrophobicity': 3.8},
-    'Lys': {'weight': 146.2, 'polarity': 'polar', 'charge': 'positive', 'hydrophobicity': -3.9},
-    'Met': {'weight': 149.2, 'polarity': 'nonpolar', 'charge': 'neutral', 'hydrophobicity': 1.9},
-    'Phe': {'weight': 165.2, 'polarity': 'nonpolar', 'charge': 'neutral', 'hydrophobicity': 2.8},
-    'Pro': {'weight': 115.1, 'polarity': 'nonpolar', 'charge': 'neutral', 'hydrophobicity': -1.6},
-    'Ser': {'weight': 105.1, 'polarity': 'polar', 'charge': 'neutral', 'hydrophobicity': -0.8},
-    'Thr': {'weight': 119.1, 'polarity': 'polar', 'charge': 'neutral', 'hydrophobicity': -0.7},
-    'Trp': {'weight': 204.2, 'polarity': 'nonpolar', 'charge': 'neutral', 'hydrophobicity': -0.9},
-    'Tyr': {'weight': 181.2, 'polarity': 'polar', 'charge': 'neutral', 'hydrophobicity': -1.3},
-    'Val': {'weight': 117.1, 'polarity': 'nonpolar', 'charge': 'neutral', 'hydrophobicity': 4.2}
-}
\ No newline at end of file
+    aa: {'weight': weight, 'polarity': polarity, 'charge': charge, 'hydrophobicity': hydrophobicity}
+    for aa, weight, polarity, charge, hydrophobicity in _AA_TABLE
+}
@@ -0,0 +1,305 @@
+# Copyright 2025 SNPraefentia Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Input cache module.
+
+This module keeps Parquet copies of parsed input files so that repeated
+runs on the same input skip the CSV/Excel parsing step, and memoizes the
+results of network lookups. Persisting to disk is opt-in: it is only
+active when the SNPRAEFENTIA_CACHE_DIR environment variable points to a
+directory. Writing the input cache requires pyarrow.
+"""
+
+import atexit
+import functools
+import hashlib
+import logging
+import os
+import shelve
+import threading
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR_ENV = "SNPRAEFENTIA_CACHE_DIR"
+
+# Number of bytes hashed from each end of the input for its fingerprint
+_FINGERPRINT_BYTES = 1 << 16
+
+# Shelf holding persisted lookup results, opened on first use
+_lookup_shelf = None
+_lookup_shelf_path = None
+_lookup_lock = threading.Lock()
+
+def get_cache_dir():
+    """Return the cache directory, creating it if needed.
+
+    Returns:
+        Path to the cache directory, or None if caching is disabled
+    """
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if not cache_dir:
+        return None
+    cache_dir = os.path.expanduser(cache_dir)
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+def file_fingerprint(file_path):
+    """Fingerprint a file from its first and last bytes, size and mtime.
+
+    Only a fixed amount of data is read, so the cost doesn't grow with
+    the size of the input.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Hex digest identifying the current file contents
+    """
+    stat = os.stat(file_path)
+    with open(file_path, 'rb') as f:
+        head = f.read(_FINGERPRINT_BYTES)
+        f.seek(max(stat.st_size - _FINGERPRINT_BYTES, len(head)))
+        tail = f.read(_FINGERPRINT_BYTES)
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(head)
+    digest.update(tail)
+    digest.update(stat.st_size.to_bytes(8, 'little'))
+    digest.update(stat.st_mtime_ns.to_bytes(8, 'little'))
+    return digest.hexdigest()
+
+def cached_table_path(file_path):
+    """Return the Parquet cache path for an input file.
+
+    Args:
+        file_path: Path to the input file
+
+    Returns:
+        Path of the cache entry (which may not exist yet), or None if
+        caching is disabled
+    """
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+    return os.path.join(cache_dir, f"{file_fingerprint(file_path)}.parquet")
+
+def read_cached_table(cache_path):
+    """Load a cached table if it exists.
+
+    Args:
+        cache_path: Path returned by cached_table_path
+
+    Returns:
+        DataFrame, or None on a cache miss
+    """
+    if cache_path is None or not os.path.exists(cache_path):
+        return None
+    import pandas as pd
+    try:
+        df = pd.read_parquet(cache_path)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache entry {cache_path}: {str(e)}")
+        return None
+    logger.debug(f"Loaded cached input from {cache_path}")
+    return df
+
+def iter_cached_table(cache_path, chunksize):
+    """Stream a cached table in chunks of rows.
+
+    Args:
+        cache_path: Path returned by cached_table_path
+        chunksize: Number of rows per chunk
+
+    Returns:
+        Iterator of DataFrames, or None on a cache miss
+    """
+    if cache_path is None or not os.path.exists(cache_path):
+        return None
+    try:
+        import pyarrow.parquet as pq
+        parquet_file = pq.ParquetFile(cache_path)
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache entry {cache_path}: {str(e)}")
+        return None
+    logger.debug(f"Streaming cached input from {cache_path}")
+    return iter_parquet_batches(parquet_file, chunksize)
+
+def iter_parquet_batches(parquet_file, chunksize, columns=None):
+    """Yield Parquet row batches as DataFrames with a running index.
+
+    Args:
+        parquet_file: Open pyarrow.parquet.ParquetFile
+        chunksize: Number of rows per batch
+        columns: Optional list of columns to read
+
+    Yields:
+        DataFrames of at most chunksize rows; one empty frame for an empty file
+    """
+    import pandas as pd
+    start = 0
+    for batch in parquet_file.iter_batches(batch_size=chunksize, columns=columns):
+        df = batch.to_pandas()
+        df.index = pd.RangeIndex(start, start + len(df))
+        start += len(df)
+        yield df
+    if start == 0:
+        empty = parquet_file.schema_arrow.empty_table()
+        yield (empty.select(columns) if columns is not None else empty).to_pandas()
+
+def write_cached_table(df, cache_path):
+    """Store a parsed table in the cache, ignoring failures.
+
+    Args:
+        df: DataFrame to cache
+        cache_path: Path returned by cached_table_path
+    """
+    if cache_path is None:
+        return
+    tmp_path = f"{cache_path}.tmp"
+    try:
+        df.to_parquet(tmp_path, compression='zstd', index=False)
+        os.replace(tmp_path, cache_path)
+        logger.debug(f"Cached input to {cache_path}")
+    except Exception as e:
+        logger.debug(f"Could not cache input: {str(e)}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+class CachedTableWriter:
+    """Write a table to the cache one chunk at a time.
+
+    The entry only becomes visible once close() is called after every
+    chunk was written. Any failure (pyarrow missing, chunks with
+    incompatible column types) silently abandons the entry.
+    """
+
+    def __init__(self, cache_path):
+        self.cache_path = cache_path
+        self.tmp_path = f"{cache_path}.tmp" if cache_path else None
+        self._writer = None
+        self._failed = cache_path is None
+
+    def write(self, df):
+        """Append a chunk to the cache entry."""
+        if self._failed:
+            return
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self.tmp_path, table.schema, compression='zstd')
+            else:
+                table = table.cast(self._writer.schema)
+            self._writer.write_table(table)
+        except Exception as e:
+            logger.debug(f"Could not cache input: {str(e)}")
+            self.abort()
+
+    def close(self):
+        """Publish the cache entry if every chunk was written."""
+        if self._failed:
+            return
+        if self._writer is not None:
+            self._writer.close()
+            os.replace(self.tmp_path, self.cache_path)
+            logger.debug(f"Cached input to {self.cache_path}")
+
+    def abort(self):
+        """Discard a partially written cache entry."""
+        self._failed = True
+        if self._writer is not None:
+            try:
+                self._writer.close()
+            except Exception:
+                pass
+            self._writer = None
+        if self.tmp_path and os.path.exists(self.tmp_path):
+            os.remove(self.tmp_path)
+
+def _open_lookup_shelf():
+    """Return the lookup shelf for the current cache directory.
+
+    Must be called with _lookup_lock held.
+    """
+    global _lookup_shelf, _lookup_shelf_path
+    cache_dir = get_cache_dir()
+    if cache_dir is None:
+        return None
+    path = os.path.join(cache_dir, "lookups")
+    if _lookup_shelf_path != path:
+        _close_lookup_shelf()
+        try:
+            _lookup_shelf = shelve.open(path)
+        except Exception as e:
+            logger.debug(f"Could not open lookup cache: {str(e)}")
+            _lookup_shelf = None
+        _lookup_shelf_path = path
+    return _lookup_shelf
+
+def _close_lookup_shelf():
+    """Close the lookup shelf if it is open."""
+    global _lookup_shelf, _lookup_shelf_path
+    if _lookup_shelf is not None:
+        try:
+            _lookup_shelf.close()
+        except Exception as e:
+            logger.debug(f"Could not close lookup cache: {str(e)}")
+    _lookup_shelf = None
+    _lookup_shelf_path = None
+
+atexit.register(_close_lookup_shelf)
+
+def _plain(value):
+    """Convert numpy scalars to Python ones so cache keys are stable."""
+    return value.item() if hasattr(value, 'item') else value
+
+def cached_lookup(func):
+    """Memoize a lookup function by its positional arguments.
+    
+    Results are kept in memory for the lifetime of the process and, when
+    caching is enabled, stored on disk for later runs. None results are
+    cached in neither layer since they may come from a transient network
+    failure, so the lookup is retried on the next call. Keyword arguments
+    (e.g. an HTTP session) are passed through to func but are not part of
+    the cache key.
+    
+    Args:
+        func: Function to memoize
+        
+    Returns:
+        Memoized function
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+    memo = {}
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = f"{name}{tuple(_plain(arg) for arg in args)!r}"
+        with _lookup_lock:
+            if key in memo:
+                return memo[key]
+            shelf = _open_lookup_shelf()
+            if shelf is not None and key in shelf:
+                result = memo[key] = shelf[key]
+                return result
+        result = func(*args, **kwargs)
+        if result is not None:
+            with _lookup_lock:
+                memo[key] = result
+                shelf = _open_lookup_shelf()
+                if shelf is not None:
+                    shelf[key] = result
+        return result
+
+    wrapper.cache_clear = memo.clear
+    return wrapper
@@ -20,34 +20,288 @@ the SNPraefentia analysis pipeline.
 import pandas as pd
 import logging
 import os
+import weakref
+from ..config import CHUNK_SIZE, CATEGORY_MAX_UNIQUE_RATIO
+from .cache import (
+    CachedTableWriter,
+    cached_table_path,
+    file_fingerprint,
+    iter_cached_table,
+    iter_parquet_batches,
+    read_cached_table,
+    write_cached_table,
+)
 
 logger = logging.getLogger(__name__)
 
+# Columns every input file must provide
+REQUIRED_COLUMNS = ['Evidence', 'Amino_Acid_Position', 'Effect', 'Gene']
+_REQUIRED_SET = frozenset(REQUIRED_COLUMNS)
+# Column indexes that already passed validate_columns, keyed by id()
+_validated_columns = {}
+# Optional columns the pipeline also uses; any other column is not loaded
+OPTIONAL_COLUMNS = ['Bacterial_Specie']
+# Highly repetitive columns that are always stored as categoricals
+CATEGORICAL_COLUMNS = ['Gene', 'Effect']
+# All used columns hold text, so parsers can skip type inference
+_INPUT_DTYPES = {col: 'string' for col in REQUIRED_COLUMNS + OPTIONAL_COLUMNS}
+
+# Binary columnar formats; these load fast enough that they bypass the input cache
+_COLUMNAR_EXTENSIONS = ('.parquet', '.feather')
+
+_SUPPORTED_FORMATS = ".csv, .tsv, .txt, .xlsx, .xls, .parquet, .feather"
+
+# Parsed Excel sheets keyed by (path, fingerprint); see _read_excel
+_parsed_sheets = {}
+_PARSED_SHEETS_MAX = 4
+
+def _is_input_column(name):
+    """Return True for columns the pipeline reads from input files."""
+    return name in _INPUT_DTYPES
+
 
 def validate_columns(df):
     """Validate that the DataFrame has all required columns with correct names.
     
+    A frame whose columns were already validated returns immediately.
+    Changing the columns always creates a new column Index, so a frame is
+    validated again after any column is added, dropped or renamed.
+    
     Args:
         df: DataFrame to validate
         
     Raises:
         ValueError: If required columns are missing or have incorrect names
     """
-    required_columns = ['Evidence', 'Amino_Acid_Position', 'Effect', 'Gene']
-    missing_columns = [col for col in required_columns if col not in df.columns]
+    columns = df.columns
+    validated = _validated_columns.get(id(columns))
+    if validated is not None and validated() is columns:
+        return
     
-    if missing_columns:
+    missing = _REQUIRED_SET.difference(columns)
+    
+    if missing:
+        # Report in the documented column order
+        missing_columns = [col for col in REQUIRED_COLUMNS if col in missing]
         error_msg = (
             #f"Input file is missing required columns or has incorrect column names.\n"
             f"Missing/Incorrect columns: {'  '.join(missing_columns)}\n"
-            f"Required column headers must be exactly: {'  '.join(required_columns)}"
+            f"Required column headers must be exactly: {'  '.join(REQUIRED_COLUMNS)}"
         )
         raise ValueError(error_msg)
+    
+    # The weak reference drops the entry once the Index is garbage collected
+    key = id(columns)
+    _validated_columns[key] = weakref.ref(columns, lambda _: _validated_columns.pop(key, None))
+
+def categorize_columns(df, max_unique_ratio=CATEGORY_MAX_UNIQUE_RATIO):
+    """Convert low-cardinality string columns to the categorical dtype.
+    
+    Repeated strings are then stored once, with each row holding a small
+    integer code instead of its own string object. Columns listed in
+    CATEGORICAL_COLUMNS are converted regardless of their cardinality.
+    
+    Args:
+        df: DataFrame to convert in place
+        max_unique_ratio: Largest ratio of unique values to rows for which
+            a column is converted
+        
+    Returns:
+        The same DataFrame
+    """
+    if len(df) == 0:
+        return df
+    for col in df.columns:
+        values = df[col]
+        if not (pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values)):
+            continue
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            continue
+        if col in CATEGORICAL_COLUMNS or values.nunique() / len(df) < max_unique_ratio:
+            df[col] = values.astype('category')
+    return df
+
+def _open_calamine(file_path):
+    """Open a workbook with the Rust-backed calamine engine.
+    
+    Args:
+        file_path: Path to input Excel file
+        
+    Returns:
+        pandas ExcelFile, or None when the engine is unavailable
+    """
+    try:
+        return pd.ExcelFile(file_path, engine='calamine')
+    except (ImportError, ValueError) as e:
+        # ImportError: python-calamine missing; ValueError: pandas too old to know the engine
+        logger.debug(f"Calamine engine unavailable ({str(e)}), using default Excel engine")
+        return None
+
+def _parse_first_sheet(workbook):
+    """Parse the used columns of a workbook's first sheet, then close it."""
+    # Close the file handle as soon as the sheet is parsed
+    with workbook:
+        return workbook.parse(sheet_name=0, usecols=_is_input_column, dtype=_INPUT_DTYPES)
+
+def _read_excel(file_path, workbook=None):
+    """Read an Excel sheet, preferring the Rust-backed calamine engine.
+    
+    The last few parsed sheets are kept in memory, keyed by the file's
+    fingerprint, so loading an unchanged workbook again skips the
+    decompression and XML parsing. Workbooks are always closed after
+    parsing; only the resulting frames are kept.
+    
+    Args:
+        file_path: Path to input Excel file
+        workbook: Optional ExcelFile already opened on file_path; it is closed
+        
+    Returns:
+        DataFrame with the first sheet's contents
+    """
+    key = (os.path.abspath(file_path), file_fingerprint(file_path))
+    df = _parsed_sheets.get(key)
+    if df is None:
+        if workbook is None:
+            workbook = _open_calamine(file_path)
+        if workbook is None:
+            workbook = pd.ExcelFile(file_path)
+        df = _parse_first_sheet(workbook)
+        if len(_parsed_sheets) >= _PARSED_SHEETS_MAX:
+            _parsed_sheets.pop(next(iter(_parsed_sheets)))
+        _parsed_sheets[key] = df
+    elif workbook is not None:
+        workbook.close()
+    # Callers convert columns in place, so the cached frame is never handed out
+    return df.copy()
+
+def _read_delimited(file_path, sep):
+    """Read a CSV/TSV file, preferring the multithreaded PyArrow parser.
+    
+    Args:
+        file_path: Path to input text file
+        sep: Field delimiter
+        
+    Returns:
+        DataFrame with the file's contents
+    """
+    # The pyarrow engine only accepts a list of columns that all exist
+    header = pd.read_csv(file_path, sep=sep, nrows=0).columns
+    usecols = [col for col in header if _is_input_column(col)]
+    dtype = {col: _INPUT_DTYPES[col] for col in usecols}
+    try:
+        return pd.read_csv(file_path, sep=sep, usecols=usecols, dtype=dtype,
+                           engine='pyarrow', dtype_backend='pyarrow')
+    except (ImportError, TypeError) as e:
+        # ImportError: pyarrow missing; TypeError: pandas too old for dtype_backend
+        logger.debug(f"PyArrow CSV engine unavailable ({str(e)}), using C engine")
+        return pd.read_csv(file_path, sep=sep, usecols=usecols, dtype=dtype)
+
+def _iter_arrow_csv_chunks(file_path, sep, chunksize):
+    """Stream a CSV/TSV file with PyArrow's multithreaded incremental reader.
+    
+    Args:
+        file_path: Path to input text file
+        sep: Field delimiter
+        chunksize: Number of rows per yielded DataFrame
+        
+    Yields:
+        DataFrames of chunksize rows (the last may be shorter); one empty
+        frame for a file without rows
+    
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    
+    header = pd.read_csv(file_path, sep=sep, nrows=0).columns
+    usecols = [col for col in header if _is_input_column(col)]
+    dtype = {col: _INPUT_DTYPES[col] for col in usecols}
+    reader = pa_csv.open_csv(
+        file_path,
+        parse_options=pa_csv.ParseOptions(delimiter=sep),
+        # Empty fields and "NA"-like strings are missing, as with read_csv,
+        # whose defaults also include "None" and "<NA>"
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=usecols,
+            column_types={col: pa.string() for col in usecols},
+            null_values=[*pa_csv.ConvertOptions().null_values, 'None', '<NA>'],
+            strings_can_be_null=True,
+        ),
+    )
+    
+    def frame(table, start):
+        df = table.to_pandas().astype(dtype)
+        df.index = pd.RangeIndex(start, start + len(df))
+        return df
+    
+    # Arrow batches follow the reader's block size, so rows are regrouped
+    start = 0
+    pending = pa.Table.from_batches([], schema=reader.schema)
+    for batch in reader:
+        pending = pa.concat_tables([pending, pa.Table.from_batches([batch])])
+        while pending.num_rows >= chunksize:
+            yield frame(pending.slice(0, chunksize), start)
+            start += chunksize
+            pending = pending.slice(chunksize)
+    if pending.num_rows or start == 0:
+        yield frame(pending, start)
+
+def _iter_delimited_chunks(file_path, sep, chunksize):
+    """Stream a CSV/TSV file, preferring the PyArrow incremental reader.
+    
+    Args:
+        file_path: Path to input text file
+        sep: Field delimiter
+        chunksize: Number of rows per yielded DataFrame
+        
+    Yields:
+        DataFrames of at most chunksize rows
+    """
+    try:
+        import pyarrow.csv  # noqa: F401
+    except ImportError as e:
+        logger.debug(f"PyArrow CSV reader unavailable ({str(e)}), using C engine")
+        yield from pd.read_csv(file_path, sep=sep, usecols=_is_input_column, dtype=_INPUT_DTYPES,
+                               chunksize=chunksize)
+        return
+    yield from _iter_arrow_csv_chunks(file_path, sep, chunksize)
+
+def _columnar_input_columns(file_path, file_ext):
+    """List the used columns present in a Parquet or Feather file."""
+    if file_ext == '.parquet':
+        import pyarrow.parquet as pq
+        names = pq.read_schema(file_path).names
+    else:
+        import pyarrow.ipc as ipc
+        with ipc.open_file(file_path) as reader:
+            names = reader.schema.names
+    return [col for col in names if _is_input_column(col)]
+
+def _read_columnar(file_path, file_ext):
+    """Read a Parquet or Feather file, keeping only the used columns.
+    
+    Args:
+        file_path: Path to input file
+        file_ext: '.parquet' or '.feather'
+        
+    Returns:
+        DataFrame with the file's contents
+    """
+    columns = _columnar_input_columns(file_path, file_ext)
+    if file_ext == '.parquet':
+        df = pd.read_parquet(file_path, columns=columns)
+    else:
+        df = pd.read_feather(file_path, columns=columns)
+    return df.astype({col: _INPUT_DTYPES[col] for col in columns})
 
 def load_data(file_path):
     """Load SNP data from a file.
     
-    Supports CSV (.csv), TSV (.tsv, .txt), and Excel (.xlsx, .xls) formats.
+    Supports CSV (.csv), TSV (.tsv, .txt), Excel (.xlsx, .xls), Parquet
+    (.parquet) and Feather (.feather) formats; the last two require pyarrow.
+    Parsed text and Excel inputs are cached as Parquet when
+    SNPRAEFENTIA_CACHE_DIR is set.
     
     Args:
         file_path: Path to input file
@@ -57,19 +311,139 @@ def load_data(file_path):
     """
     file_ext = os.path.splitext(file_path)[1].lower()
     
+    cache_path = None if file_ext in _COLUMNAR_EXTENSIONS else cached_table_path(file_path)
+    df = read_cached_table(cache_path)
+    if df is not None:
+        validate_columns(df)
+        logger.info(f"Loaded {len(df)} SNPs from cache for {file_path}")
+        return categorize_columns(df)
+    
     logger.debug(f"Loading data from {file_path} (format: {file_ext})")
     
     if file_ext in ['.xlsx', '.xls']:
-        df = pd.read_excel(file_path)
+        df = _read_excel(file_path)
     elif file_ext == '.csv':
-        df = pd.read_csv(file_path)
+        df = _read_delimited(file_path, ',')
     elif file_ext in ['.tsv', '.txt']:
-        df = pd.read_csv(file_path, sep='\t')
+        df = _read_delimited(file_path, '\t')
+    elif file_ext in _COLUMNAR_EXTENSIONS:
+        df = _read_columnar(file_path, file_ext)
     else:
-        raise ValueError(f"Unsupported file format: {file_ext}. Supported formats: .csv, .tsv, .txt, .xlsx, .xls")
+        raise ValueError(f"Unsupported file format: {file_ext}. Supported formats: {_SUPPORTED_FORMATS}")
         
     # Validate column names
     validate_columns(df)
+    write_cached_table(df, cache_path)
     
     logger.info(f"Loaded {len(df)} SNPs from {file_path}")
-    return df
\ No newline at end of file
+    return categorize_columns(df)
+
+def _iter_xlsx_chunks(file_path, chunksize):
+    """Stream an .xlsx sheet row by row with openpyxl's read-only mode.
+    
+    Args:
+        file_path: Path to input Excel file
+        chunksize: Number of rows per yielded DataFrame
+        
+    Yields:
+        DataFrames of at most chunksize rows
+    """
+    from openpyxl import load_workbook
+    
+    workbook = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = list(next(rows, ()))
+        keep = [i for i, name in enumerate(header) if _is_input_column(name)]
+        columns = [header[i] for i in keep]
+        dtype = {col: _INPUT_DTYPES[col] for col in columns}
+        
+        def frame(buffer, start):
+            df = pd.DataFrame(buffer, columns=columns, index=pd.RangeIndex(start, start + len(buffer)))
+            return df.astype(dtype)
+        
+        start = 0
+        buffer = []
+        for row in rows:
+            buffer.append([row[i] if i < len(row) else None for i in keep])
+            if len(buffer) == chunksize:
+                yield frame(buffer, start)
+                start += len(buffer)
+                buffer = []
+        if buffer or start == 0:
+            yield frame(buffer, start)
+    finally:
+        workbook.close()
+
+def load_data_chunks(file_path, chunksize=CHUNK_SIZE):
+    """Load SNP data from a file in chunks of rows.
+    
+    Supports the same formats as load_data, but never holds more than one
+    chunk of the raw input in memory. At least one (possibly empty) chunk
+    is always yielded so that column validation runs.
+    
+    Args:
+        file_path: Path to input file
+        chunksize: Number of rows per chunk
+        
+    Yields:
+        DataFrames with SNP data
+        
+    Raises:
+        ValueError: If the format is unsupported or required columns are missing
+    """
+    file_ext = os.path.splitext(file_path)[1].lower()
+    
+    cache_path = None if file_ext in _COLUMNAR_EXTENSIONS else cached_table_path(file_path)
+    cached_chunks = iter_cached_table(cache_path, chunksize)
+    if cached_chunks is not None:
+        for chunk in cached_chunks:
+            validate_columns(chunk)
+            yield categorize_columns(chunk)
+        return
+    
+    logger.debug(f"Streaming data from {file_path} (format: {file_ext}, chunksize: {chunksize})")
+    
+    # Excel sheets hold at most about a million rows, so when calamine is
+    # installed reading the whole sheet at once beats streaming it
+    workbook = _open_calamine(file_path) if file_ext == '.xlsx' else None
+    if file_ext == '.xlsx' and workbook is None:
+        chunks = _iter_xlsx_chunks(file_path, chunksize)
+    elif file_ext == '.parquet':
+        import pyarrow.parquet as pq
+        columns = _columnar_input_columns(file_path, file_ext)
+        chunks = (
+            chunk.astype({col: _INPUT_DTYPES[col] for col in columns})
+            for chunk in iter_parquet_batches(pq.ParquetFile(file_path), chunksize, columns)
+        )
+    elif file_ext in ['.xlsx', '.xls', '.feather']:
+        # None of these are read incrementally here
+        if workbook is not None:
+            df = _read_excel(file_path, workbook)
+        elif file_ext == '.xls':
+            df = _read_excel(file_path)
+        else:
+            df = _read_columnar(file_path, file_ext)
+        chunks = (df.iloc[i:i + chunksize] for i in range(0, max(len(df), 1), chunksize))
+    elif file_ext == '.csv':
+        chunks = _iter_delimited_chunks(file_path, ',', chunksize)
+    elif file_ext in ['.tsv', '.txt']:
+        chunks = _iter_delimited_chunks(file_path, '\t', chunksize)
+    else:
+        raise ValueError(f"Unsupported file format: {file_ext}. Supported formats: {_SUPPORTED_FORMATS}")
+    
+    cache_writer = CachedTableWriter(cache_path)
+    total = 0
+    try:
+        for chunk in chunks:
+            validate_columns(chunk)
+            cache_writer.write(chunk)
+            total += len(chunk)
+            yield categorize_columns(chunk)
+    except BaseException:
+        # Includes GeneratorExit when the caller stops early
+        cache_writer.abort()
+        raise
+    cache_writer.close()
+    
+    logger.info(f"Loaded {total} SNPs from {file_path}")
@@ -17,15 +17,21 @@ This module handles the output and formatting of results from
 the SNPraefentia analysis pipeline.
 """
 
+import importlib.util
 import logging
 import os
+import numpy as np
+from ..config import CHUNK_SIZE
 
 logger = logging.getLogger(__name__)
 
 def save_data(df, file_path):
     """Save processed SNP data to a file.
     
-    Supports CSV (.csv), TSV (.tsv, .txt), and Excel (.xlsx, .xls) formats.
+    Supports CSV (.csv), TSV (.tsv, .txt), Excel (.xlsx, .xls), Parquet
+    (.parquet) and Feather (.feather) formats; the last two require pyarrow.
+    float32 columns are written as float64 holding their shortest decimal
+    form, so a score of 0.153 is saved as 0.153 and not 0.1529999971389771.
     
     Args:
         df: DataFrame with processed SNP data
@@ -46,18 +52,24 @@ def save_data(df, file_path):
         ]
         
         # Filter and reorder columns
-        df_output = df[columns_to_keep]
+        df_output = _widen_float32_columns(df[columns_to_keep])
         
         file_ext = os.path.splitext(file_path)[1].lower()
         
         logger.debug(f"Saving data to {file_path} (format: {file_ext})")
         
-        if file_ext in ['.xlsx', '.xls']:
+        if file_ext == '.xlsx' and importlib.util.find_spec('xlsxwriter'):
+            _write_xlsx_streaming(df_output, file_path)
+        elif file_ext in ['.xlsx', '.xls']:
             df_output.to_excel(file_path, index=False)
         elif file_ext == '.csv':
             df_output.to_csv(file_path, index=False)
         elif file_ext in ['.tsv', '.txt']:
             df_output.to_csv(file_path, sep='\t', index=False)
+        elif file_ext == '.parquet':
+            df_output.to_parquet(file_path, compression='zstd', index=False)
+        elif file_ext == '.feather':
+            df_output.reset_index(drop=True).to_feather(file_path)
         else:
             # Default to CSV if extension not recognized
             logger.warning(f"Unrecognized file extension: {file_ext}. Defaulting to CSV format.")
@@ -66,4 +78,68 @@ def save_data(df, file_path):
         logger.info(f"Saved {len(df_output)} SNPs to {file_path}")
     except Exception as e:
         logger.error(f"Error saving data: {str(e)}")
-        raise ValueError(f"Could not save data to {file_path}: {str(e)}")
\ No newline at end of file
+        raise ValueError(f"Could not save data to {file_path}: {str(e)}")
+
+def _float32_to_decimal(values):
+    """Widen float32 values to the shortest decimals they stand for.
+    
+    A plain cast turns float32(0.153) into 0.1529999971389771; instead each
+    value becomes the float64 with the fewest decimals that still rounds to
+    the same float32, here 0.153.
+    
+    Args:
+        values: float32 array
+        
+    Returns:
+        float64 array
+    """
+    wide = values.astype(np.float64)
+    result = wide.copy()
+    pending = np.isfinite(values)
+    # float32 keeps at most 9 significant digits; smaller values that need
+    # more decimals than tried here are left as the plain cast
+    for decimals in range(10):
+        if not pending.any():
+            break
+        rounded = np.round(wide, decimals)
+        exact = pending & (rounded.astype(np.float32) == values)
+        result[exact] = rounded[exact]
+        pending &= ~exact
+    return result
+
+def _widen_float32_columns(df):
+    """Return df with its float32 columns widened by _float32_to_decimal."""
+    float32_columns = [col for col in df.columns if df[col].dtype == np.float32]
+    if not float32_columns:
+        return df
+    return df.assign(**{col: _float32_to_decimal(df[col].to_numpy()) for col in float32_columns})
+
+def _write_xlsx_streaming(df, file_path):
+    """Write a DataFrame to .xlsx with xlsxwriter's constant-memory mode.
+    
+    Rows are flushed to disk as they are written, so memory use doesn't grow
+    with the table. pandas' own xlsxwriter output writes column by column,
+    which constant-memory mode can't handle, hence the explicit row loop.
+    Without xlsxwriter, save_data falls back to pandas' default Excel
+    writer, which keeps the whole sheet in memory.
+    
+    Args:
+        df: DataFrame to write
+        file_path: Path of the .xlsx file
+    """
+    import xlsxwriter
+    workbook = xlsxwriter.Workbook(file_path, {'constant_memory': True})
+    try:
+        worksheet = workbook.add_worksheet()
+        header = workbook.add_format({'bold': True, 'border': 1, 'align': 'center'})
+        worksheet.write_row(0, 0, df.columns, header)
+        # Rows are converted to Python objects one slice at a time, so no
+        # object copy of the whole table is ever held
+        for start in range(0, len(df), CHUNK_SIZE):
+            part = df.iloc[start:start + CHUNK_SIZE]
+            # Missing values become empty cells
+            rows = part.astype(object).where(part.notna(), None)
+            for row_num, row in enumerate(rows.itertuples(index=False, name=None), start=start + 1):
+                worksheet.write_row(row_num, 0, row)
+    finally:
+        workbook.close()
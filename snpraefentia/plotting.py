@@ -12,6 +12,19 @@ from matplotlib.lines import Line2D
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 import os
 
+def _read_results(path):
+    """Read a results file written by save_data in any supported format."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in [".xlsx", ".xls"]:
+        return pd.read_excel(path)
+    if ext == ".parquet":
+        return pd.read_parquet(path)
+    if ext == ".feather":
+        return pd.read_feather(path)
+    if ext in [".tsv", ".txt"]:
+        return pd.read_csv(path, sep="\t")
+    return pd.read_csv(path)
+
 def plot_boxplot(input_csv, output_dir):
     """Generate a boxplot for Normalized Depth and Amino Acid Impact Scores.
 
@@ -19,11 +32,7 @@ def plot_boxplot(input_csv, output_dir):
         input_csv (str): Path to the input CSV file.
         output_dir (str): Directory to save the output plots.
     """
-    ext = os.path.splitext(input_csv)[1].lower()
-    if ext in [".xlsx", ".xls"]:
-        df = pd.read_excel(input_csv)
-    else:
-        df = pd.read_csv(input_csv)
+    df = _read_results(input_csv)
     required_cols = ["Normalized_Depth", "Amino_Acid_Impact_Score"]
     for col in required_cols:
         if col not in df.columns:
@@ -78,11 +87,7 @@ def plot_pie_chart(input_csv, output_dir):
         input_csv (str): Path to the input CSV file.
         output_dir (str): Directory to save the output plots.
     """
-    ext = os.path.splitext(input_csv)[1].lower()
-    if ext in [".xlsx", ".xls"]:
-        df = pd.read_excel(input_csv)
-    else:
-        df = pd.read_csv(input_csv)
+    df = _read_results(input_csv)
     if 'Domain_Position_Match' not in df.columns:
         raise ValueError("Column 'Domain_Position_Match' not found in input file for pie chart.")
     domain_counts = df['Domain_Position_Match'].value_counts()
@@ -146,11 +151,7 @@ def plot_histogram(input_csv, output_dir):
         input_csv (str): Path to the input CSV file.
         output_dir (str): Directory to save the output plots.
     """
-    ext = os.path.splitext(input_csv)[1].lower()
-    if ext in [".xlsx", ".xls"]:
-        df = pd.read_excel(input_csv)
-    else:
-        df = pd.read_csv(input_csv)
+    df = _read_results(input_csv)
     if 'Final_Priority_Score' not in df.columns:
         raise ValueError("Column 'Final_Priority_Score' not found in input file for histogram.")
     scores = df['Final_Priority_Score'].dropna()
@@ -202,11 +203,7 @@ def plot_top_variants(input_csv, output_dir, top_n=20):
         output_dir (str): Directory to save the output plots.
         top_n (int): Number of top variants to display.
     """
-    ext = os.path.splitext(input_csv)[1].lower()
-    if ext in [".xlsx", ".xls"]:
-        df = pd.read_excel(input_csv)
-    else:
-        df = pd.read_csv(input_csv)
+    df = _read_results(input_csv)
     required_cols = ["Final_Priority_Score", "Normalized_Depth", "Amino_Acid_Impact_Score", "Domain_Position_Match", "Gene"]
     for col in required_cols:
         if col not in df.columns:
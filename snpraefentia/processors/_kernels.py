@@ -0,0 +1,106 @@
+# Copyright 2025 SNPraefentia Authors. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Compiled kernels for the processing modules.
+
+Numba is an optional dependency. When it is not installed the kernels are
+still defined as plain Python functions, but callers should check
+NUMBA_AVAILABLE and use their pandas/numpy implementation instead.
+"""
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def _is_word_byte(c):
+    # Mirrors the regex \b definition for ASCII text, the only input scanned
+    return (48 <= c <= 57) or (65 <= c <= 90) or (97 <= c <= 122) or c == 95
+
+
+@njit(cache=True)
+def max_depth_scan(buf, offsets, out):
+    """Find the largest "<base>:<count>" value in each encoded evidence string.
+
+    Args:
+        buf: uint8 array holding all evidence strings back to back
+        offsets: int64 array of string boundaries (len(out) + 1 entries)
+        out: int64 array receiving the maximum depth per string (0 if none)
+    """
+    for row in range(out.size):
+        start = offsets[row]
+        end = offsets[row + 1]
+        best = 0
+        i = start
+        while i < end - 2:
+            c = buf[i]
+            if ((c == 65 or c == 67 or c == 71 or c == 84)
+                    and buf[i + 1] == 58
+                    and 48 <= buf[i + 2] <= 57
+                    and (i == start or not _is_word_byte(buf[i - 1]))):
+                j = i + 2
+                value = 0
+                while j < end and 48 <= buf[j] <= 57:
+                    value = value * 10 + (int(buf[j]) - 48)
+                    j += 1
+                if value > best:
+                    best = value
+                i = j
+            else:
+                i += 1
+        out[row] = best
+
+
+@njit(cache=True)
+def minmax(values):
+    """Return (min, max) of a non-empty 1-D array in a single pass."""
+    lo = values[0]
+    hi = values[0]
+    for i in range(1, values.size):
+        v = values[i]
+        if v < lo:
+            lo = v
+        elif v > hi:
+            hi = v
+    return lo, hi
+
+
+@njit(parallel=True, cache=True)
+def normalize_range(values, lo, span, out):
+    """Write (values - lo) / span into out, splitting rows across threads.
+
+    A zero span means every value equals lo, and out is filled with 1.
+    """
+    if span == 0:
+        out[:] = 1
+        return
+    scale = 1.0 / span
+    for i in prange(values.size):
+        out[i] = (values[i] - lo) * scale
+
+
+@njit(fastmath=True, parallel=True, cache=True)
+def weighted_sum3(a, b, c, wa, wb, wc, out):
+    """Write wa * a + wb * b + wc * c into out, splitting rows across threads."""
+    for i in prange(a.size):
+        out[i] = wa * a[i] + wb * b[i] + wc * c[i]
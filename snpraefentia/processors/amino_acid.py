@@ -21,10 +21,17 @@ as part of the SNPraefentia analysis pipeline.
 
 import re
 import logging
-from ..db.aa_properties import AA_PROPERTIES
+import numpy as np
+import pandas as pd
+from ..db.aa_properties import (
+    AA_CHARGE, AA_HYDROPHOBICITY, AA_INDEX, AA_POLARITY, AA_WEIGHT
+)
 
 logger = logging.getLogger(__name__)
 
+# Protein-level HGVS change, e.g. "p.Ala123Gly" -> "Ala123Gly"
+_AA_CHANGE_RE = re.compile(r'p\.([A-Z][a-z]{2}\d+[A-Z][a-z]{2})')
+
 def extract_aa_change(effect_str):
     """Extract amino acid changes from EFFECT column.
     
@@ -34,12 +41,60 @@ def extract_aa_change(effect_str):
     Returns:
         Amino acid change string (e.g., "AlaGly")
     """
-    try:
-        match = re.search(r'p\.([A-Z][a-z]{2}\d+[A-Z][a-z]{2})', str(effect_str))
-        return match.group(1) if match else None
-    except Exception as e:
-        logger.debug(f"Could not extract AA change: {str(e)}")
+    if not isinstance(effect_str, str):
         return None
+    match = _AA_CHANGE_RE.search(effect_str)
+    return match.group(1) if match else None
+
+def extract_aa_change_series(effects):
+    """Extract amino acid changes from a whole EFFECT column.
+    
+    A categorical column is parsed once per category and the result is
+    mapped back to the rows through the category codes.
+    
+    Args:
+        effects: Series of effect strings
+        
+    Returns:
+        Series of amino acid change strings, missing where none is found
+    """
+    if not isinstance(effects.dtype, pd.CategoricalDtype):
+        return effects.astype('string').str.extract(_AA_CHANGE_RE, expand=False)
+    changes = pd.Series(effects.cat.categories).astype('string').str.extract(_AA_CHANGE_RE, expand=False)
+    # Missing rows have code -1, which picks the trailing NA
+    changes = pd.concat([changes, pd.Series([pd.NA], dtype='string')], ignore_index=True)
+    return pd.Series(changes.to_numpy()[effects.cat.codes.to_numpy()], index=effects.index, dtype='string')
+
+# Impact scores for every (ref, mut) pair, indexed through AA_INDEX. Kept
+# as float64 so the scores hold exactly their 3-decimal values.
+_AA_IMPACT = np.round(
+    np.abs(AA_WEIGHT[:, None] - AA_WEIGHT[None, :]) / 130
+    + np.abs(AA_HYDROPHOBICITY[:, None] - AA_HYDROPHOBICITY[None, :]) / 9
+    + (AA_POLARITY[:, None] != AA_POLARITY[None, :])
+    + (AA_CHARGE[:, None] != AA_CHARGE[None, :]),
+    3
+)
+
+def compute_aa_impact_series(aa_changes):
+    """Calculate amino acid impact scores for a whole AA_Change column.
+    
+    Args:
+        aa_changes: Series of amino acid change strings (e.g., "Ala123Gly")
+        
+    Returns:
+        Array of impact scores (float64), 0 where the change is missing
+        or doesn't name two known amino acids
+    """
+    changes = pd.Series(np.asarray(aa_changes, dtype=object)).astype('string')
+    ref = changes.str.slice(0, 3).map(AA_INDEX)
+    mut = changes.str.slice(-3).map(AA_INDEX)
+    valid = ((changes.str.len() >= 6) & ref.notna() & mut.notna()).to_numpy(dtype=bool, na_value=False)
+    
+    scores = np.zeros(len(changes), dtype=np.float64)
+    ref_idx = ref[valid].to_numpy(dtype=np.intp)
+    mut_idx = mut[valid].to_numpy(dtype=np.intp)
+    scores[valid] = _AA_IMPACT[ref_idx, mut_idx]
+    return scores
 
 def compute_aa_impact(row):
     """Calculate amino acid impact score.
@@ -51,20 +106,6 @@ def compute_aa_impact(row):
         Impact score as a float
     """
     aa_change = row.get('AA_Change')
-    if not isinstance(aa_change, str) or len(aa_change) < 6:
+    if not isinstance(aa_change, str):
         return 0
-    
-    try:
-        ref, mut = aa_change[:3], aa_change[-3:]
-        
-        if ref in AA_PROPERTIES and mut in AA_PROPERTIES:
-            weight_diff = abs(AA_PROPERTIES[ref]['weight'] - AA_PROPERTIES[mut]['weight']) / 130
-            hydro_diff = abs(AA_PROPERTIES[ref]['hydrophobicity'] - AA_PROPERTIES[mut]['hydrophobicity']) / 9
-            polarity_change = int(AA_PROPERTIES[ref]['polarity'] != AA_PROPERTIES[mut]['polarity'])
-            charge_change = int(AA_PROPERTIES[ref]['charge'] != AA_PROPERTIES[mut]['charge'])
-            
-            return round(weight_diff + hydro_diff + polarity_change + charge_change, 3)
-    except Exception as e:
-        logger.debug(f"Error computing AA impact: {str(e)}")
-    
-    return 0
\ No newline at end of file
+    return round(float(compute_aa_impact_series([aa_change])[0]), 3)
\ No newline at end of file
@@ -20,9 +20,14 @@ data as part of the SNPraefentia analysis pipeline.
 import re
 import logging
 import numpy as np
+import pandas as pd
+from ._kernels import NUMBA_AVAILABLE, max_depth_scan, minmax, normalize_range
 
 logger = logging.getLogger(__name__)
 
+# Base call followed by its read count, e.g. "A:10"
+_DEPTH_RE = re.compile(r'\b([AGCT]):(\d+)')
+
 def extract_depth(evidence):
     """Extract maximum depth from EVIDENCE column.
     
@@ -32,13 +37,68 @@ def extract_depth(evidence):
     Returns:
         Maximum depth as an integer
     """
-    try:
-        matches = re.findall(r'\b([AGCT]):(\d+)', str(evidence))
-        depths = [int(depth) for base, depth in matches]
-        return max(depths) if depths else 0
-    except Exception as e:
-        logger.warning(f"Error extracting depth: {str(e)}")
+    # Missing values (NaN/None) can't hold a depth
+    if not isinstance(evidence, str):
         return 0
+    depths = [int(depth) for base, depth in _DEPTH_RE.findall(evidence)]
+    return max(depths, default=0)
+
+def extract_depth_series(evidence_series):
+    """Extract maximum depth for a whole EVIDENCE column at once.
+    
+    Vectorized counterpart of extract_depth: the regex is run over the
+    column in a single pass and the per-row maximum is reduced with numpy.
+    When numba is installed the column is scanned by a compiled kernel
+    instead. Repeated strings are only parsed once: a categorical column
+    is parsed per category, and the regex path first deduplicates values.
+    
+    Args:
+        evidence_series: Series of strings containing depth information
+        
+    Returns:
+        Array of maximum depths (int64), 0 where no depth was found
+    """
+    if isinstance(getattr(evidence_series, 'dtype', None), pd.CategoricalDtype):
+        codes = evidence_series.cat.codes.to_numpy()
+        uniques = np.asarray(evidence_series.cat.categories, dtype=object)
+    elif NUMBA_AVAILABLE:
+        # Scanning every row is cheaper than hashing it for deduplication
+        return _extract_depth_jit(np.asarray(evidence_series, dtype=object))
+    else:
+        codes, uniques = pd.factorize(np.asarray(evidence_series, dtype=object))
+    scan = _extract_depth_jit if NUMBA_AVAILABLE else _extract_depth_regex
+    # Missing rows have code -1, which picks the trailing 0
+    return np.append(scan(uniques), np.int64(0))[codes]
+
+def _extract_depth_regex(values):
+    """Find the maximum depth of each evidence string with the regex."""
+    # Work on a positional index so duplicate labels can't merge rows
+    evidence = pd.Series(values, dtype=object).astype(str)
+    # Read counts can exceed the int32 range
+    matches = evidence.str.extractall(_DEPTH_RE)[1].astype(np.int64)
+    return (
+        matches.groupby(level=0).max()
+        .reindex(range(len(evidence)), fill_value=0)
+        .to_numpy(dtype=np.int64)
+    )
+
+def _extract_depth_jit(values):
+    """Scan evidence strings with the compiled kernel in a single buffer."""
+    # The kernel works on ASCII bytes, while the regex's \b and \d are
+    # Unicode-aware, so non-ASCII strings are left to the regex. They and
+    # missing values are scanned as empty strings.
+    ascii_only = [isinstance(value, str) and value.isascii() for value in values]
+    encoded = [value.encode('ascii') if ok else b'' for value, ok in zip(values, ascii_only)]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(value) for value in encoded], out=offsets[1:])
+    buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+    out = np.empty(len(encoded), dtype=np.int64)
+    max_depth_scan(buf, offsets, out)
+    
+    other = [i for i, (value, ok) in enumerate(zip(values, ascii_only)) if not ok and isinstance(value, str)]
+    if other:
+        out[other] = _extract_depth_regex([values[i] for i in other])
+    return out
 
 def normalize_depth(depth_series):
     """Normalize depth values to range [0, 1].
@@ -47,12 +107,24 @@ def normalize_depth(depth_series):
         depth_series: Series of depth values
         
     Returns:
-        Series of normalized depth values
+        Series of normalized depth values (float32)
     """
-    min_depth = depth_series.min()
-    max_depth = depth_series.max()
+    depths = np.asarray(depth_series, dtype=np.float32)
+    index = getattr(depth_series, 'index', None)
+    if not depths.size:
+        min_depth = max_depth = 0
+    elif NUMBA_AVAILABLE:
+        min_depth, max_depth = minmax(depths)
+    else:
+        min_depth, max_depth = depths.min(), depths.max()
     
-    if max_depth == min_depth:
-        return np.ones(len(depth_series))
-        
-    return (depth_series - min_depth) / (max_depth - min_depth)
\ No newline at end of file
+    span = max_depth - min_depth
+    if NUMBA_AVAILABLE:
+        normalized = np.empty_like(depths)
+        normalize_range(depths, min_depth, span, normalized)
+    else:
+        # A zero span (all depths equal) leaves every value at 1
+        normalized = np.ones_like(depths)
+        np.subtract(depths, min_depth, out=normalized, where=span != 0)
+        np.divide(normalized, span, out=normalized, where=span != 0)
+    return pd.Series(normalized, index=index)
@@ -18,13 +18,39 @@ database. It performs protein identification by searching the UniProt database u
 """
 
 import logging
+import threading
 import requests
+import numpy as np
 import pandas as pd
 from io import StringIO
+from ..config import UNIPROT_MAX_WORKERS
 
 logger = logging.getLogger(__name__)
 
-def search_uniprot(gene, species_taxid, target_length, tolerance=50):
+# Session shared by all lookups, created on first use
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
+    """Return the HTTP session used for UniProt requests.
+    
+    Reusing one session keeps connections to the UniProt server alive
+    between requests, and its connection pool is sized for the number of
+    concurrent lookups.
+    
+    Returns:
+        requests.Session shared across threads
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=UNIPROT_MAX_WORKERS)
+            session.mount('https://', adapter)
+            _session = session
+        return _session
+
+def search_uniprot(gene, species_taxid, target_length, tolerance=50, session=None):
     """Search UniProt for a gene from a specific species.
     
     Args:
@@ -32,6 +58,7 @@ def search_uniprot(gene, species_taxid, target_length, tolerance=50):
         species_taxid: NCBI Taxonomy ID
         target_length: Expected protein length
         tolerance: Length tolerance for matching
+        session: Optional requests.Session; defaults to the shared session
         
     Returns:
         UniProt ID as a string, or None if not found
@@ -44,7 +71,7 @@ def search_uniprot(gene, species_taxid, target_length, tolerance=50):
         url = f"https://rest.uniprot.org/uniprotkb/search?query={query}&fields=accession,gene_names,organism_name,length&format=tsv&size=50"
         
         logger.debug(f"Querying UniProt: {url}")
-        response = requests.get(url)
+        response = (session or get_session()).get(url)
         
         if response.status_code != 200:
             logger.warning(f"UniProt request failed: {response.status_code}")
@@ -71,44 +98,103 @@ def search_uniprot(gene, species_taxid, target_length, tolerance=50):
         logger.warning(f"Error searching UniProt: {str(e)}")
         return None
 
-def check_domain_position(uniprot_id, mutated_position):
-    """Check if a mutated position is within a protein domain.
+def fetch_domain_ranges(uniprot_id, session=None):
+    """Fetch the domain boundaries annotated on a UniProt entry.
     
     Args:
         uniprot_id: UniProt ID
-        mutated_position: Position of the mutation
+        session: Optional requests.Session; defaults to the shared session
         
     Returns:
-        1 if within a domain, 0 otherwise
+        List of (begin, end) tuples, or None if the entry could not be fetched
     """
-    if pd.isna(uniprot_id) or pd.isna(mutated_position):
-        return 0
-        
     try:
         url = f"https://rest.uniprot.org/uniprotkb/{uniprot_id}.json"
         logger.debug(f"Querying UniProt for domains: {url}")
         
-        response = requests.get(url)
+        response = (session or get_session()).get(url)
         if response.status_code != 200:
             logger.warning(f"UniProt domain request failed: {response.status_code}")
-            return 0
+            return None
             
-        data = response.json()
-        features = data.get('features', [])
-        
-        for feature in features:
+        ranges = []
+        for feature in response.json().get('features', []):
             if feature.get('type') == 'Domain':
                 begin = feature.get('location', {}).get('start', {}).get('value')
                 end = feature.get('location', {}).get('end', {}).get('value')
                 
                 if begin is not None and end is not None:
-                    if int(begin) <= int(mutated_position) <= int(end):
-                        logger.debug(f"Position {mutated_position} is within domain {begin}-{end}")
-                        return 1
+                    ranges.append((int(begin), int(end)))
+        return ranges
+        
+    except Exception as e:
+        logger.warning(f"Error fetching domains: {str(e)}")
+        return None
+
+def check_domain_position(uniprot_id, mutated_position):
+    """Check if a mutated position is within a protein domain.
+    
+    Args:
+        uniprot_id: UniProt ID
+        mutated_position: Position of the mutation
+        
+    Returns:
+        1 if within a domain, 0 otherwise
+    """
+    if pd.isna(uniprot_id) or pd.isna(mutated_position):
+        return 0
+        
+    try:
+        for begin, end in fetch_domain_ranges(uniprot_id) or []:
+            if begin <= int(mutated_position) <= end:
+                logger.debug(f"Position {mutated_position} is within domain {begin}-{end}")
+                return 1
                         
         logger.debug(f"Position {mutated_position} is not within any domain")
         return 0
         
     except Exception as e:
         logger.warning(f"Error checking domain position: {str(e)}")
-        return 0
\ No newline at end of file
+        return 0
+
+def positions_in_domains(uniprot_ids, positions, domain_ranges):
+    """Check many mutated positions against prefetched domain ranges.
+    
+    Equivalent to calling check_domain_position for every row, without
+    any further requests.
+    
+    Args:
+        uniprot_ids: Series of UniProt IDs
+        positions: Series of mutated positions
+        domain_ranges: Dictionary mapping UniProt IDs to fetch_domain_ranges results
+        
+    Returns:
+        float32 array with 1 for positions within a domain, 0 otherwise
+    """
+    codes, uniques = pd.factorize(pd.Series(uniprot_ids, dtype=object))
+    positions = pd.to_numeric(pd.Series(positions), errors='coerce').to_numpy(dtype=np.float64, na_value=np.nan)
+    result = np.zeros(len(codes), dtype=np.float32)
+    
+    ranges = [
+        (code, begin, end)
+        for code, uid in enumerate(uniques)
+        for begin, end in domain_ranges.get(uid) or []
+    ]
+    valid = (codes >= 0) & ~np.isnan(positions)
+    if not ranges or not valid.any():
+        return result
+    range_codes, begins, ends = (np.array(column, dtype=np.float64) for column in zip(*ranges))
+    order = np.lexsort((begins, range_codes))
+    range_codes, begins, ends = range_codes[order], begins[order], ends[order]
+    # Running maximum of the domain ends within each entry, so the last domain
+    # starting at or before a position tells whether any domain covers it
+    ends = pd.Series(ends).groupby(range_codes).cummax().to_numpy()
+    
+    # Search (entry, position) pairs as one sorted key
+    scale = max(begins.max(), positions[valid].max()) + 1
+    row_codes = codes[valid]
+    row_positions = positions[valid]
+    idx = np.searchsorted(range_codes * scale + begins, row_codes * scale + row_positions, side='right') - 1
+    safe = np.maximum(idx, 0)
+    result[valid] = (idx >= 0) & (range_codes[safe] == row_codes) & (ends[safe] >= row_positions)
+    return result
@@ -24,38 +24,176 @@ The scoring methodologies used here are patent-protected.
 """
 
 import logging
+import numpy as np
+import pandas as pd
+from .processors._kernels import NUMBA_AVAILABLE, weighted_sum3
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
 
 logger = logging.getLogger(__name__)
 
+# Fixed feature weights
+# Depth has highest weight (2.0) as it's a direct measure of evidence
+# AA impact and domain position have equal weights (1.0)
+DEPTH_WEIGHT = 2.0
+AA_IMPACT_WEIGHT = 1.0
+DOMAIN_WEIGHT = 1.0
+
+# Largest attainable weighted sum: depth and domain match are in [0, 1],
+# while the AA impact score combines four terms that are each at most 1.
+# Dividing by it keeps the final score in [0, 1].
+MAX_WEIGHTED_SUM = DEPTH_WEIGHT * 1 + AA_IMPACT_WEIGHT * 4 + DOMAIN_WEIGHT * 1
+
+_INV_MAX_WEIGHTED_SUM = 1.0 / MAX_WEIGHTED_SUM
+_WEIGHTS = np.array(
+    [DEPTH_WEIGHT, AA_IMPACT_WEIGHT, DOMAIN_WEIGHT], dtype=np.float32
+) * np.float32(_INV_MAX_WEIGHTED_SUM)
+
+# Feature columns the score is computed from
+_REQUIRED_COLUMNS = frozenset({'Normalized_Depth', 'Amino_Acid_Impact_Score', 'Domain_Position_Match'})
+
+def _is_polars_frame(df):
+    """Return True for a Polars DataFrame, without importing polars.
+    
+    Raises:
+        TypeError: For any other Polars object, such as a LazyFrame
+    """
+    if type(df).__module__.split('.')[0] != 'polars':
+        return False
+    if type(df).__name__ != 'DataFrame':
+        raise TypeError(
+            f"Expected a Polars DataFrame, got {type(df).__name__}; "
+            f"collect a LazyFrame before scoring it"
+        )
+    return True
+
+def _polars_priority_score(df):
+    """Compute the priority score of a Polars DataFrame with one expression."""
+    import polars as pl
+    
+    def feature(name):
+        # Missing values (null or NaN) count as 0, as on the pandas path
+        return pl.col(name).cast(pl.Float32).fill_nan(0).fill_null(0)
+    
+    w_depth, w_aa, w_domain = (float(w) for w in _WEIGHTS)
+    score = (
+        w_depth * pl.col('Normalized_Depth').cast(pl.Float32)
+        + w_aa * feature('Amino_Acid_Impact_Score')
+        + w_domain * feature('Domain_Position_Match')
+    )
+    return df.select(score.cast(pl.Float32).alias('Final_Priority_Score')).to_series()
+
+def _check_columns(df):
+    """Raise a KeyError if df lacks any of the feature columns."""
+    missing = _REQUIRED_COLUMNS.difference(df.columns)
+    if missing:
+        raise KeyError(f"Missing columns for scoring: {', '.join(sorted(missing))}")
+
+def _feature_arrays(df):
+    """Return the depth, AA impact and domain match columns as float32 arrays."""
+    # One conversion per feature; the pipeline produces them NaN-free, other
+    # callers get missing AA impact and domain values counted as 0
+    return (
+        df['Normalized_Depth'].to_numpy(dtype=np.float32),
+        df['Amino_Acid_Impact_Score'].to_numpy(dtype=np.float32, na_value=0),
+        df['Domain_Position_Match'].to_numpy(dtype=np.float32, na_value=0),
+    )
+
+def _score_from_arrays(depth, aa_impact, domain_match):
+    """Combine the feature arrays into scores with the fixed weights.
+    
+    The array-level core of calculate_priority_score, for callers that
+    already hold the features as arrays and want to skip building pandas
+    objects. Uses the compiled kernel or numexpr's blocked, multithreaded
+    evaluator when available, otherwise a single matrix-vector product.
+    
+    Args:
+        depth: Normalized depths
+        aa_impact: Amino acid impact scores, without missing values
+        domain_match: Domain position matches, without missing values
+        
+    Returns:
+        Array of priority scores (float32)
+    """
+    # No-ops for the float32 arrays produced by _feature_arrays
+    depth, aa_impact, domain_match = (
+        np.ascontiguousarray(values, dtype=np.float32)
+        for values in (depth, aa_impact, domain_match)
+    )
+    out = np.empty(len(depth), dtype=np.float32)
+    if NUMBA_AVAILABLE:
+        # The normalization is folded into the weights, so each row
+        # costs two FMAs
+        weighted_sum3(depth, aa_impact, domain_match, *_WEIGHTS, out)
+    elif numexpr is not None:
+        w_depth, w_aa, w_domain = _WEIGHTS
+        numexpr.evaluate(
+            "w_depth * depth + w_aa * aa_impact + w_domain * domain_match",
+            local_dict={
+                'depth': depth, 'aa_impact': aa_impact, 'domain_match': domain_match,
+                'w_depth': w_depth, 'w_aa': w_aa, 'w_domain': w_domain
+            },
+            out=out
+        )
+    else:
+        out = np.column_stack((depth, aa_impact, domain_match)) @ _WEIGHTS
+    return out
+
 def calculate_priority_score(df):
     """Calculate the final priority score for each SNP.
     
+    A Polars DataFrame is scored natively by Polars and gives a Polars
+    Series; polars itself is only imported in that case.
+    
     Args:
         df: DataFrame with processed SNP data
         
     Returns:
-        Series of priority scores
-    """
-    try:
-        # Ensure domain position is numeric
-        df['Domain_Position_Match'] = df['Domain_Position_Match'].fillna(0).astype(float)
-        
-        # Fill missing AA impact scores with 0
-        df['Amino_Acid_Impact_Score'] = df['Amino_Acid_Impact_Score'].fillna(0)
-        
-        # Calculate score with fixed weights
-        # Depth has highest weight (2.0) as it's a direct measure of evidence
-        # AA impact and domain position have equal weights (1.0)
-        score = (
-            2.0 * df['Normalized_Depth'] + 
-            1.0 * df['Amino_Acid_Impact_Score'] +
-            1.0 * df['Domain_Position_Match']
-        ) / 7
+        Series of priority scores (float32)
         
+    Raises:
+        KeyError: If any of the feature columns is missing
+        TypeError: If df is a Polars object other than a DataFrame
+    """
+    is_polars = _is_polars_frame(df)
+    _check_columns(df)
+    if is_polars:
+        return _polars_priority_score(df)
+    
+    score = pd.Series(_score_from_arrays(*_feature_arrays(df)), index=df.index)
+    
+    # The summary costs three passes over the scores, so skip it unless shown
+    if logger.isEnabledFor(logging.DEBUG):
         logger.debug(f"Calculated priority scores (min={score.min()}, max={score.max()}, mean={score.mean()})")
-        return score
+    return score
+
+def calculate_priority_scores_batched(dfs):
+    """Calculate priority scores for several pandas DataFrames at once.
+    
+    The feature columns of all frames are joined and scored in a single
+    pass, which avoids the per-call overhead when scoring many small frames
+    (e.g. one per species).
+    
+    Args:
+        dfs: Iterable of DataFrames with processed SNP data
         
-    except Exception as e:
-        logger.error(f"Error calculating priority score: {str(e)}")
-        # Return zeros as fallback
-        return [0] * len(df)
\ No newline at end of file
+    Returns:
+        List of Series of priority scores (float32), one per input frame and
+        indexed like it
+        
+    Raises:
+        KeyError: If any frame lacks one of the feature columns
+    """
+    dfs = list(dfs)
+    for df in dfs:
+        _check_columns(df)
+    if not dfs:
+        return []
+    
+    columns = zip(*(_feature_arrays(df) for df in dfs))
+    scores = _score_from_arrays(*(np.concatenate(column) for column in columns))
+    bounds = np.cumsum([len(df) for df in dfs])[:-1]
+    return [pd.Series(part, index=df.index) for part, df in zip(np.split(scores, bounds), dfs)]
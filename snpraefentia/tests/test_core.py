@@ -1,18 +1,20 @@
 """Tests for the core SNPraefentia functionality."""
 
 import unittest
+from unittest import mock
 import pandas as pd
-from snpraefentia.core import SNPAnalyst
+from snpraefentia.core import SNPAnalyst, concat_frames, extract_row_features
 
 class TestSNPAnalyst(unittest.TestCase):
     """Test the SNPAnalyst class."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.analyst = SNPAnalyst()
+    @classmethod
+    def setUpClass(cls):
+        """Set up test data shared by all tests; tests must not modify it."""
+        cls.analyst = SNPAnalyst()
         
         # Create a minimal test dataframe
-        self.test_df = pd.DataFrame({
+        cls.test_df = pd.DataFrame({
             'Evidence': ['A:10 C:5', 'G:20 T:8', 'T:30 A:15'],
             'Effect': ['p.Ala123Gly', 'p.Trp456Leu', 'missense_variant'],
             'Gene': ['geneA', 'geneB', 'geneC'],
@@ -22,7 +24,7 @@ class TestSNPAnalyst(unittest.TestCase):
     def test_process_dataframe(self):
         """Test processing a dataframe."""
         specie = "Escherichia coli"
-        result = self.analyst.process_dataframe(self.test_df, specie)
+        result = self.analyst.process_dataframe(self.test_df.copy(), specie)
         
         # Check that all expected columns are present
         expected_columns = [
@@ -46,7 +48,91 @@ class TestSNPAnalyst(unittest.TestCase):
         self.assertEqual(result['AA_Change'].iloc[0], 'Ala123Gly')
         
         # Check that final score is between 0 and 1
-        self.assertTrue(all(0 <= score <= 1 for score in result['Final_Priority_Score']))
+        scores = result['Final_Priority_Score']
+        self.assertTrue(((scores >= 0) & (scores <= 1)).all())
+
+    def test_annotate_dataframe_deduplicates_lookups(self):
+        """Test that UniProt is queried once per distinct gene/taxid/length."""
+        df = pd.DataFrame({
+            'Evidence': ['A:1', 'A:2', 'A:3'],
+            'Effect': ['p.Ala1Gly'] * 3,
+            'Gene': ['geneA_1', 'geneA_2', 'geneB'],
+            'Amino_Acid_Position': ['5/100', '6/100', '1/50']
+        })
+        with mock.patch('snpraefentia.core.search_uniprot', side_effect=lambda gene, *_: f"U_{gene}") as search, \
+                mock.patch('snpraefentia.core.fetch_domain_ranges', return_value=[(6, 10)]):
+            result = self.analyst.annotate_dataframe(df, "Escherichia coli", tax_id=562)
+
+        self.assertEqual(search.call_count, 2)
+        self.assertEqual(list(result['UniProt_ID']), ['U_geneA', 'U_geneA', 'U_geneB'])
+        self.assertEqual(list(result['Domain_Position_Match']), [0, 1, 0])
+
+    def test_annotate_dataframe_parallel(self):
+        """Test that splitting row parsing across processes gives the same result."""
+        with mock.patch('snpraefentia.core.search_uniprot', return_value=None), \
+                mock.patch('snpraefentia.core.PARALLEL_MIN_ROWS', 2):
+            serial = self.analyst.annotate_dataframe(self.test_df.copy(), "Escherichia coli", tax_id=562)
+            parallel = SNPAnalyst(n_jobs=2).annotate_dataframe(self.test_df.copy(), "Escherichia coli", tax_id=562)
+
+        pd.testing.assert_frame_equal(serial, parallel)
+
+    def test_extract_row_features_without_positions(self):
+        """Test parsing chunks in which no position has a length."""
+        empty = pd.Series([], dtype='string')
+        features = extract_row_features(empty, empty, empty)
+        self.assertEqual(len(features), 0)
+        self.assertIn('Total_Protein_Length', features.columns)
+
+        missing = pd.Series([None, None], dtype='string')
+        features = extract_row_features(pd.Series(['A:1', 'A:2']), pd.Series(['p.Ala1Gly'] * 2), missing)
+        self.assertTrue(features['Total_Protein_Length'].isna().all())
+        self.assertTrue(features['Mutated_AA'].isna().all())
+
+    def test_process_dataframe_without_genes(self):
+        """Test processing empty input and input with every gene missing."""
+        no_genes = pd.DataFrame({
+            'Evidence': ['A:1', 'A:2'],
+            'Effect': ['p.Ala1Gly'] * 2,
+            'Gene': [None, None],
+            'Amino_Acid_Position': ['5/100', '6/100']
+        })
+        with mock.patch('snpraefentia.core.search_uniprot') as search:
+            result = self.analyst.process_dataframe(no_genes, "Escherichia coli", tax_id=562)
+            empty = self.analyst.process_dataframe(no_genes.iloc[:0], "Escherichia coli", tax_id=562)
+
+        search.assert_not_called()
+        self.assertTrue(result['UniProt_ID'].isna().all())
+        self.assertEqual(list(result['Depth']), [1, 2])
+        self.assertEqual(len(empty), 0)
+
+    def test_concat_annotated_chunks(self):
+        """Test joining chunks where only some have UniProt matches."""
+        chunks = [
+            pd.DataFrame({
+                'Evidence': ['A:1', 'A:2'],
+                'Effect': ['p.Ala1Gly'] * 2,
+                'Gene': ['geneA', 'geneA'],
+                'Amino_Acid_Position': ['5/100', '6/100'],
+                'Bacterial_Specie': ['Escherichia_coli', None]
+            }),
+            pd.DataFrame({
+                'Evidence': ['A:3'],
+                'Effect': ['p.Ala1Gly'],
+                'Gene': ['geneB'],
+                'Amino_Acid_Position': ['1/50'],
+                'Bacterial_Specie': [None]
+            }, index=[2]),
+        ]
+        with mock.patch('snpraefentia.core.search_uniprot', side_effect=lambda gene, *_: 'P1' if gene == 'geneA' else None), \
+                mock.patch('snpraefentia.core.fetch_domain_ranges', return_value=[(6, 10)]):
+            annotated = [self.analyst.annotate_dataframe(chunk, "Escherichia coli", tax_id=562) for chunk in chunks]
+        result = self.analyst.score_dataframe(concat_frames(annotated))
+
+        self.assertEqual(result['UniProt_ID'].tolist()[:2], ['P1', 'P1'])
+        self.assertTrue(pd.isna(result['UniProt_ID'].iloc[2]))
+        self.assertIsInstance(result['UniProt_ID'].dtype, pd.CategoricalDtype)
+        self.assertEqual(list(result['Bacterial_Specie']), ["Escherichia coli"] * 3)
+        self.assertEqual(list(result['Domain_Position_Match']), [0, 1, 0])
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,240 @@
+"""Tests for SNPraefentia input/output functions."""
+
+import os
+import tempfile
+import unittest
+import importlib.util
+from unittest import mock
+import numpy as np
+import pandas as pd
+from snpraefentia.core import SNPAnalyst
+from snpraefentia.io.cache import CACHE_DIR_ENV, cached_lookup, _close_lookup_shelf
+from snpraefentia.io import loader
+from snpraefentia.io.loader import categorize_columns, load_data, load_data_chunks, validate_columns
+from snpraefentia.io.writer import save_data
+
+class TestLoader(unittest.TestCase):
+    """Test data loading functions."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.test_df = pd.DataFrame({
+            'Evidence': ['A:10 C:5', 'G:20 T:8', 'T:30 A:15', 'C:7'],
+            'Effect': ['p.Ala123Gly', 'p.Trp456Leu', 'missense_variant', 'p.Arg1Trp'],
+            'Gene': ['geneA', 'geneB', 'geneC', 'geneD'],
+            'Amino_Acid_Position': ['123/500', '456/300', '789/400', '1/100']
+        })
+
+    def tearDown(self):
+        """Remove temporary files."""
+        self.tmp_dir.cleanup()
+
+    def _write(self, name):
+        path = os.path.join(self.tmp_dir.name, name)
+        if name.endswith('.xlsx'):
+            self.test_df.to_excel(path, index=False)
+        else:
+            self.test_df.to_csv(path, sep='\t' if name.endswith('.tsv') else ',', index=False)
+        return path
+
+    def test_load_data_chunks(self):
+        """Test that chunked loading returns the same rows as load_data."""
+        for name in ['snps.csv', 'snps.tsv', 'snps.xlsx']:
+            path = self._write(name)
+            chunks = list(load_data_chunks(path, chunksize=3))
+
+            self.assertEqual([len(chunk) for chunk in chunks], [3, 1])
+            combined = pd.concat(chunks)
+            self.assertEqual(list(combined.index), [0, 1, 2, 3])
+            self.assertEqual(list(combined['Evidence']), list(load_data(path)['Evidence']))
+
+    def test_excel_sheet_memo(self):
+        """Test that an unchanged workbook is parsed once and re-parsed after edits."""
+        path = self._write('memo.xlsx')
+        with mock.patch('snpraefentia.io.loader._parse_first_sheet', wraps=loader._parse_first_sheet) as parse:
+            first = load_data(path)
+            first['Evidence'] = 'changed'
+            second = load_data(path)
+            self.assertEqual(parse.call_count, 1)
+            self.assertEqual(list(second['Evidence']), list(self.test_df['Evidence']))
+
+            self.test_df = self.test_df.iloc[:2]
+            os.remove(path)
+            self.assertEqual(len(load_data(self._write('memo.xlsx'))), 2)
+            self.assertEqual(parse.call_count, 2)
+
+    def test_load_data_chunks_missing_values(self):
+        """Test that empty and NA-like fields load as missing in every chunk."""
+        path = os.path.join(self.tmp_dir.name, 'gaps.csv')
+        self.test_df.assign(Gene=['geneA', '', 'NA', 'None']).to_csv(path, index=False)
+        chunks = list(load_data_chunks(path, chunksize=2))
+
+        genes = pd.concat(chunks)['Gene']
+        self.assertEqual(genes.iloc[0], 'geneA')
+        self.assertTrue(genes.iloc[1:].isna().all())
+
+    def test_load_data_chunks_missing_columns(self):
+        """Test that chunked loading validates column names."""
+        path = os.path.join(self.tmp_dir.name, 'bad.csv')
+        self.test_df.drop(columns=['Gene']).to_csv(path, index=False)
+
+        with self.assertRaises(ValueError):
+            next(load_data_chunks(path))
+
+    def test_validate_columns(self):
+        """Test that validation is skipped only while the columns are unchanged."""
+        validate_columns(self.test_df)
+        validate_columns(self.test_df)
+        
+        with self.assertRaises(ValueError):
+            validate_columns(self.test_df.drop(columns=['Gene']))
+        self.test_df.pop('Effect')
+        with self.assertRaises(ValueError):
+            validate_columns(self.test_df)
+        
+    def test_load_data_skips_unused_columns(self):
+        """Test that only the columns used by the pipeline are loaded."""
+        self.test_df['Position'] = [10, 20, 30, 40]
+        for name in ['snps.csv', 'snps.xlsx']:
+            path = self._write(name)
+            for df in [load_data(path), next(load_data_chunks(path))]:
+                self.assertEqual(sorted(df.columns), ['Amino_Acid_Position', 'Effect', 'Evidence', 'Gene'])
+
+    def test_categorize_columns(self):
+        """Test that only low-cardinality string columns become categorical."""
+        df = pd.DataFrame({
+            'Gene': ['geneA', 'geneA', 'geneA', 'geneA', 'geneB'],
+            'Evidence': ['A:1', 'A:2', 'A:3', 'A:4', 'A:5'],
+            'Depth': [1, 1, 1, 1, 1]
+        })
+        categorize_columns(df)
+
+        self.assertIsInstance(df['Gene'].dtype, pd.CategoricalDtype)
+        self.assertNotIsInstance(df['Evidence'].dtype, pd.CategoricalDtype)
+        self.assertNotIsInstance(df['Depth'].dtype, pd.CategoricalDtype)
+
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), "pyarrow is required for the input cache")
+    def test_input_cache(self):
+        """Test that a cached input is served without re-parsing."""
+        path = self._write('snps.csv')
+        cache_dir = os.path.join(self.tmp_dir.name, 'cache')
+
+        with mock.patch.dict(os.environ, {CACHE_DIR_ENV: cache_dir}):
+            first = pd.concat(load_data_chunks(path, chunksize=3))
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+            with mock.patch('snpraefentia.io.loader._read_delimited') as read:
+                cached = load_data(path)
+                read.assert_not_called()
+
+        self.assertEqual(list(cached['Evidence']), list(first['Evidence']))
+
+    def test_cached_lookup(self):
+        """Test that lookups are memoized in memory and persisted on disk."""
+        calls = []
+        def lookup(gene, taxid, session=None):
+            calls.append(gene)
+            return None if gene == 'missing' else f"{gene}_{taxid}_{session}"
+        cache_dir = os.path.join(self.tmp_dir.name, 'cache')
+
+        with mock.patch.dict(os.environ, {CACHE_DIR_ENV: cache_dir}):
+            cached = cached_lookup(lookup)
+            self.assertEqual(cached('geneA', 562, session='s'), 'geneA_562_s')
+            # Keyword arguments are forwarded but not part of the key
+            self.assertEqual(cached('geneA', 562), 'geneA_562_s')
+            self.assertIsNone(cached('missing', 562))
+            # None is not memoized in memory either, so it is retried
+            self.assertIsNone(cached('missing', 562))
+            self.assertEqual(calls, ['geneA', 'missing', 'missing'])
+
+            # A fresh wrapper (e.g. a later run) reads the persisted result
+            cached = cached_lookup(lookup)
+            self.assertEqual(cached('geneA', 562), 'geneA_562_s')
+            self.assertIsNone(cached('missing', 562))
+            self.assertEqual(calls, ['geneA', 'missing', 'missing', 'missing'])
+            _close_lookup_shelf()
+
+class TestWriter(unittest.TestCase):
+    """Test data saving functions."""
+
+    def setUp(self):
+        """Set up test data."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.result_df = pd.DataFrame({
+            'Gene': ['geneA', 'geneB'],
+            'UniProt_ID': pd.Categorical(['P12345', None]),
+            'Total_Protein_Length': pd.array([500, None], dtype='Int32'),
+            'Bacterial_Specie': ['Escherichia coli'] * 2,
+            'Taxonomic_ID': pd.array([562, 562], dtype='Int32'),
+            'Normalized_Depth': [1.0, 0.0],
+            'Amino_Acid_Impact_Score': [0.153, 1.166],
+            'Domain_Position_Match': [1.0, 0.0],
+            'Final_Priority_Score': [0.5, 0.25]
+        })
+
+    def tearDown(self):
+        """Remove temporary files."""
+        self.tmp_dir.cleanup()
+
+    def test_save_data_round_trip(self):
+        """Test that saved results read back unchanged."""
+        for name in ['out.csv', 'out.tsv', 'out.xlsx']:
+            path = os.path.join(self.tmp_dir.name, name)
+            save_data(self.result_df, path)
+            if name.endswith('.xlsx'):
+                saved = pd.read_excel(path)
+            else:
+                saved = pd.read_csv(path, sep='\t' if name.endswith('.tsv') else ',')
+
+            self.assertEqual(list(saved.columns), list(self.result_df.columns))
+            self.assertEqual(list(saved['Final_Priority_Score']), [0.5, 0.25])
+            self.assertTrue(pd.isna(saved['UniProt_ID'].iloc[1]))
+            self.assertTrue(pd.isna(saved['Total_Protein_Length'].iloc[1]))
+
+    def test_save_data_float32_scores(self):
+        """Test that float32 score columns are saved without widening noise."""
+        annotated = self.result_df.drop(columns=['Normalized_Depth', 'Final_Priority_Score']).assign(
+            Depth=np.array([10, 20], dtype=np.int32),
+            Amino_Acid_Impact_Score=np.array([0.153, 1.166], dtype=np.float32),
+            Domain_Position_Match=np.array([1, 0], dtype=np.float32)
+        )
+        scored = SNPAnalyst().score_dataframe(annotated)
+        self.assertEqual(scored['Final_Priority_Score'].dtype, np.float32)
+        expected_scores = [float(str(score)) for score in scored['Final_Priority_Score'].to_numpy()]
+        
+        for name in ['out.csv', 'out.xlsx']:
+            path = os.path.join(self.tmp_dir.name, name)
+            save_data(scored, path)
+            saved = pd.read_excel(path) if name.endswith('.xlsx') else pd.read_csv(path)
+            
+            self.assertEqual(list(saved['Amino_Acid_Impact_Score']), [0.153, 1.166])
+            self.assertEqual(list(saved['Normalized_Depth']), [0.0, 1.0])
+            self.assertEqual(list(saved['Final_Priority_Score']), expected_scores)
+        
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), "pyarrow is required for Parquet and Feather")
+    def test_columnar_formats(self):
+        """Test saving and loading Parquet and Feather files."""
+        input_df = pd.DataFrame({
+            'Evidence': ['A:10 C:5', 'G:20 T:8', 'T:30 A:15'],
+            'Effect': ['p.Ala123Gly', 'p.Trp456Leu', 'missense_variant'],
+            'Gene': ['geneA', 'geneB', 'geneC'],
+            'Amino_Acid_Position': ['123/500', '456/300', '789/400'],
+            'Position': [1, 2, 3]
+        })
+        for ext in ['.parquet', '.feather']:
+            out_path = os.path.join(self.tmp_dir.name, f'out{ext}')
+            save_data(self.result_df, out_path)
+            saved = pd.read_parquet(out_path) if ext == '.parquet' else pd.read_feather(out_path)
+            self.assertEqual(list(saved['Final_Priority_Score']), [0.5, 0.25])
+
+            in_path = os.path.join(self.tmp_dir.name, f'in{ext}')
+            input_df.to_parquet(in_path) if ext == '.parquet' else input_df.to_feather(in_path)
+            chunks = list(load_data_chunks(in_path, chunksize=2))
+            self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+            loaded = load_data(in_path)
+            self.assertNotIn('Position', loaded.columns)
+            self.assertEqual(list(loaded['Evidence']), list(input_df['Evidence']))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,9 @@
 """Tests for SNPraefentia processors."""
 
 import unittest
-from snpraefentia.processors.depth import extract_depth, normalize_depth
-from snpraefentia.processors.amino_acid import extract_aa_change, compute_aa_impact
+from snpraefentia.processors.depth import extract_depth, extract_depth_series, normalize_depth, _extract_depth_jit, _extract_depth_regex
+from snpraefentia.processors.amino_acid import extract_aa_change, extract_aa_change_series, compute_aa_impact, compute_aa_impact_series
+from snpraefentia.processors.uniprot import positions_in_domains
 import pandas as pd
 import numpy as np
 
@@ -16,6 +17,32 @@ class TestDepthProcessor(unittest.TestCase):
         self.assertEqual(extract_depth('T:30 A:15'), 30)
         self.assertEqual(extract_depth('Invalid'), 0)
         
+    def test_extract_depth_series(self):
+        """Test extracting depth from a whole evidence column."""
+        evidence = pd.Series(['A:10 C:5', 'G:20 T:8', 'Invalid', None, 'T:30 A:15'],
+                             index=[3, 3, 7, 8, 9])
+        depths = extract_depth_series(evidence)
+        
+        self.assertEqual(list(depths), [10, 20, 0, 0, 30])
+        self.assertEqual(len(extract_depth_series(pd.Series([], dtype=object))), 0)
+        # Depths beyond the int32 range are kept
+        self.assertEqual(list(extract_depth_series(pd.Series(['A:99999999999', 'C:3']))), [99999999999, 3])
+        self.assertEqual(list(extract_depth_series(pd.Series(['A:99999999999']).astype('category'))), [99999999999])
+        
+        # Repeated and categorical values map back to every row
+        repeated = pd.concat([evidence, evidence])
+        self.assertEqual(list(extract_depth_series(repeated)), [10, 20, 0, 0, 30] * 2)
+        self.assertEqual(list(extract_depth_series(repeated.astype('category'))), [10, 20, 0, 0, 30] * 2)
+        
+    def test_extract_depth_kernel_matches_regex(self):
+        """Test that the compiled scan finds the same depths as the regex."""
+        values = np.array([
+            'A:10 C:5', 'xA:3 G:4', '_T:9', 'A:10,C:20', '\u2014A:12', '\u00e9A:5 C:3',
+            'A:\u0661\u0662', 'C:7 \u00b5 G:8', 'A:99999999999', 'Invalid', '', None
+        ], dtype=object)
+        self.assertEqual(list(_extract_depth_jit(values)), list(_extract_depth_regex(values)))
+        self.assertEqual(list(_extract_depth_jit(values)), [extract_depth(value) for value in values])
+
     def test_normalize_depth(self):
         """Test depth normalization."""
         depths = pd.Series([10, 20, 30, 40, 50])
@@ -45,6 +72,17 @@ class TestAminoAcidProcessor(unittest.TestCase):
         self.assertIsNone(extract_aa_change('synonymous_variant'))
         self.assertIsNone(extract_aa_change(''))
         
+    def test_extract_aa_change_series(self):
+        """Test extracting amino acid changes from a whole effect column."""
+        effects = pd.Series(['p.Ala123Gly', 'missense_variant p.Trp456Leu', 'synonymous_variant', None])
+        changes = extract_aa_change_series(effects)
+        
+        self.assertEqual(list(changes[:2]), ['Ala123Gly', 'Trp456Leu'])
+        self.assertTrue(changes[2:].isna().all())
+        
+        # Categorical columns are parsed per category with the same result
+        pd.testing.assert_series_equal(extract_aa_change_series(effects.astype('category')), changes)
+        
     def test_compute_aa_impact(self):
         """Test computing amino acid impact score."""
         # Ala to Gly: small physicochemical change
@@ -62,6 +100,29 @@ class TestAminoAcidProcessor(unittest.TestCase):
         # Check scores
         self.assertGreater(score_large, score_small)
         self.assertEqual(score_invalid, 0)
+        
+    def test_compute_aa_impact_series(self):
+        """Test computing impact scores for a whole column."""
+        changes = pd.Series(['Ala123Gly', 'Arg456Trp', None, 'Xyz1Ala'])
+        scores = compute_aa_impact_series(changes)
+        
+        self.assertAlmostEqual(scores[0], compute_aa_impact({'AA_Change': 'Ala123Gly'}), places=5)
+        self.assertAlmostEqual(scores[1], compute_aa_impact({'AA_Change': 'Arg456Trp'}), places=5)
+        self.assertEqual(scores[2], 0)
+        self.assertEqual(scores[3], 0)
+
+class TestUniprotProcessor(unittest.TestCase):
+    """Test UniProt processing functions."""
+    
+    def test_positions_in_domains(self):
+        """Test checking positions against prefetched domain ranges."""
+        domain_ranges = {'P1': [(50, 60), (10, 40), (20, 30)], 'P2': [(5, 8)], 'P3': None}
+        uniprot_ids = pd.Series(['P1', 'P1', 'P1', 'P1', 'P2', 'P2', 'P3', None, 'P1'])
+        positions = pd.Series([10, 35, 45, 60, 45, 6, 6, 6, None])
+        
+        matches = positions_in_domains(uniprot_ids, positions, domain_ranges)
+        
+        np.testing.assert_array_equal(matches, [1, 1, 0, 1, 0, 1, 0, 0, 0])
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
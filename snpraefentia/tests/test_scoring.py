@@ -1,15 +1,18 @@
 """Tests for SNPraefentia scoring functions."""
 
 import unittest
+import importlib.util
+import numpy as np
 import pandas as pd
-from snpraefentia.scoring import calculate_priority_score
+from snpraefentia.scoring import calculate_priority_score, calculate_priority_scores_batched, _score_from_arrays
 
 class TestScoring(unittest.TestCase):
     """Test scoring functions."""
     
-    def setUp(self):
-        """Set up test data."""
-        self.test_df = pd.DataFrame({
+    @classmethod
+    def setUpClass(cls):
+        """Set up test data shared by all tests; tests must not modify it."""
+        cls.test_df = pd.DataFrame({
             'Normalized_Depth': [0.2, 0.5, 0.8],
             'Amino_Acid_Impact_Score': [0.3, 0.6, 0.9],
             'Domain_Position_Match': [0, 1, 1]
@@ -24,7 +27,7 @@ class TestScoring(unittest.TestCase):
         self.assertEqual(len(scores), 3)
         
         # Check bounds
-        self.assertTrue(all(0 <= score <= 1 for score in scores))
+        self.assertTrue(((scores >= 0) & (scores <= 1)).all())
         
         # Check relative order
         self.assertLess(scores[0], scores[1])
@@ -37,6 +40,74 @@ class TestScoring(unittest.TestCase):
         
         # Should still calculate without errors
         self.assertEqual(len(scores_with_na), 3)
+        self.assertFalse(scores_with_na.isna().any())
+        
+    def test_calculate_priority_score_nullable_columns(self):
+        """Test that nullable extension columns score like plain floats."""
+        df_with_na = self.test_df.copy()
+        df_with_na.loc[1, 'Amino_Acid_Impact_Score'] = None
+        nullable = df_with_na.astype({
+            'Amino_Acid_Impact_Score': 'Float64',
+            'Domain_Position_Match': 'Int8'
+        })
+        
+        pd.testing.assert_series_equal(
+            calculate_priority_score(nullable), calculate_priority_score(df_with_na)
+        )
+        
+    def test_score_from_arrays(self):
+        """Test that the array kernel matches the DataFrame API."""
+        scores = _score_from_arrays(
+            self.test_df['Normalized_Depth'].to_numpy(),
+            self.test_df['Amino_Acid_Impact_Score'].to_numpy(),
+            self.test_df['Domain_Position_Match'].to_numpy()
+        )
+        
+        self.assertIsInstance(scores, np.ndarray)
+        self.assertEqual(scores.dtype, np.float32)
+        np.testing.assert_array_equal(scores, calculate_priority_score(self.test_df).to_numpy())
+        
+    def test_calculate_priority_score_missing_column(self):
+        """Test that a missing feature column raises instead of scoring 0."""
+        with self.assertRaises(KeyError):
+            calculate_priority_score(self.test_df.drop(columns=['Domain_Position_Match']))
+        
+    def test_calculate_priority_score_upper_bound(self):
+        """Test that the largest possible feature values score 1."""
+        df = pd.DataFrame({
+            'Normalized_Depth': [1.0],
+            'Amino_Acid_Impact_Score': [4.0],
+            'Domain_Position_Match': [1]
+        })
+        scores = calculate_priority_score(df)
+        
+        self.assertAlmostEqual(scores[0], 1.0, places=6)
+
+    def test_calculate_priority_scores_batched(self):
+        """Test that batched scoring matches scoring each frame on its own."""
+        frames = [self.test_df, self.test_df.iloc[1:], self.test_df.iloc[:0]]
+        batched = calculate_priority_scores_batched(frames)
+        
+        self.assertEqual(len(batched), 3)
+        for scores, df in zip(batched, frames):
+            pd.testing.assert_series_equal(scores, calculate_priority_score(df))
+        self.assertEqual(calculate_priority_scores_batched([]), [])
+        
+    @unittest.skipUnless(importlib.util.find_spec('polars'), "polars is required for the Polars path")
+    def test_calculate_priority_score_polars(self):
+        """Test that Polars frames score the same as pandas frames."""
+        import polars as pl
+        df = self.test_df.copy()
+        df.loc[1, 'Amino_Acid_Impact_Score'] = None
+        scores = calculate_priority_score(pl.from_pandas(df))
+        
+        self.assertIsInstance(scores, pl.Series)
+        np.testing.assert_allclose(scores.to_numpy(), calculate_priority_score(df).to_numpy(), rtol=1e-6)
+        
+        # Only eager frames are scored; other Polars objects are rejected clearly
+        for other in [pl.from_pandas(df).lazy(), pl.from_pandas(df)['Normalized_Depth']]:
+            with self.assertRaises(TypeError):
+                calculate_priority_score(other)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file